@@ -0,0 +1,286 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from bis_lab import aco, cellular, cuckoo, gene_expression, genetic, gwo, pso
+from bis_lab.instrumentation import Instrumentation
+
+# ---------------------------------------------------------------
+# Benchmark harness for the lab optimizers
+# ---------------------------------------------------------------
+# Every (algorithm, problem, scale) case runs once with instrumentation on
+# and reports evaluations per second, wall-clock time and time to reach the
+# problem's target, then runs again under tracemalloc for its peak traced
+# memory (tracing slows the run down too much to time it). Results can be saved as a JSON
+# baseline and compared against a stored one; regressions beyond the
+# tolerance make the script exit with status 1.
+#
+#   python benchmark.py --scales small medium --save baseline.json
+#   python benchmark.py --scales small medium --baseline baseline.json
+
+ALGORITHMS = ["ga", "gea", "pso", "aco", "cuckoo", "gwo", "cellular"]
+
+
+# --- Problems ---
+# Continuous objectives take an (n, D) matrix and return n values (minimized)
+def sphere(X):
+    return np.sum(X**2, axis=1)
+
+def rastrigin(X):
+    return 10 * X.shape[1] + np.sum(X**2 - 10 * np.cos(2 * np.pi * X), axis=1)
+
+def rosenbrock(X):
+    return np.sum(100 * (X[:, 1:] - X[:, :-1]**2)**2 + (1 - X[:, :-1])**2, axis=1)
+
+CONTINUOUS = {
+    "sphere": (sphere, lambda dim: 1e-3),
+    "rastrigin": (rastrigin, lambda dim: float(dim)),
+    "rosenbrock": (rosenbrock, lambda dim: 10.0 * dim),
+}
+
+def uniform_tsp(n, rng):
+    return rng.random((n, 2)) * 1000
+
+def clustered_tsp(n, rng, clusters=8):
+    centres = rng.random((clusters, 2)) * 1000
+    return centres[rng.integers(0, clusters, n)] + rng.normal(0, 30, (n, 2))
+
+# Greedy nearest-neighbour tour length, used as the TSP target
+def nearest_neighbour_length(cities):
+    xy = np.asarray(cities)
+    unvisited = np.ones(len(xy), dtype=bool)
+    current, length = 0, 0.0
+    unvisited[0] = False
+    for _ in range(len(xy) - 1):
+        free = np.flatnonzero(unvisited)
+        d = np.hypot(*(xy[free] - xy[current]).T)
+        k = int(np.argmin(d))
+        length += d[k]
+        current = free[k]
+        unvisited[current] = False
+    return length + float(np.hypot(*(xy[current] - xy[0])))
+
+def knapsack_instance(items, rng):
+    weights = rng.integers(1, 100, items)
+    values = weights + rng.integers(1, 50, items)       # weakly correlated
+    return weights, values, int(weights.sum() // 2)
+
+# Greedy value-density solution, used as the knapsack target
+def greedy_knapsack_value(weights, values, capacity):
+    total_w = total_v = 0
+    for i in np.argsort(-values / weights):
+        if total_w + weights[i] <= capacity:
+            total_w += weights[i]
+            total_v += values[i]
+    return total_v
+
+
+# --- Scales ---
+SCALES = {
+    "small": {"dim": 10, "pop": 50, "iterations": 50, "cities": 50, "ants": 10,
+              "aco_iterations": 20, "items": 50, "grid": 32},
+    "medium": {"dim": 30, "pop": 200, "iterations": 200, "cities": 500, "ants": 10,
+               "aco_iterations": 20, "items": 500, "grid": 256},
+    "large": {"dim": 100, "pop": 1000, "iterations": 500, "cities": 5000, "ants": 10,
+              "aco_iterations": 10, "items": 5000, "grid": 1024},
+}
+
+
+# --- Algorithm adapters ---
+# Each adapter runs one case and returns its best value on the problem's
+# own (minimized) scale; instrumentation receives the optimizer's native
+# best, which `sign` maps back onto that scale.
+BITS_PER_VARIABLE = 16
+
+def run_ga(objective, scale, seed, instr, bounds=(-5.12, 5.12)):
+    dim = scale["dim"]
+    place = 2.0 ** np.arange(BITS_PER_VARIABLE - 1, -1, -1)
+
+    def evaluate(population):
+        bits = np.unpackbits(population.bits, axis=1, count=population.genes)
+        ints = bits.reshape(len(population), dim, BITS_PER_VARIABLE) @ place
+        X = bounds[0] + (bounds[1] - bounds[0]) * ints / (2**BITS_PER_VARIABLE - 1)
+        return -objective(X)
+
+    _, best = genetic.genetic_algorithm_packed(scale["pop"], dim * BITS_PER_VARIABLE, scale["iterations"],
+                                               evaluate=evaluate, seed=seed, instrumentation=instr)
+    return -best
+
+def run_gea(objective, scale, seed, instr):
+    _, best = gene_expression.gene_expression_algorithm_array(scale["pop"], scale["dim"], scale["iterations"],
+                                                              evaluate=lambda P: -objective(P), seed=seed,
+                                                              instrumentation=instr)
+    return -best
+
+def run_pso(objective, scale, seed, instr):
+    rng = np.random.default_rng(seed)
+    swarm = pso.ParticleSwarm(rng.uniform(-5, 5, (scale["pop"], scale["dim"])),
+                              fitness=lambda X: -objective(X), w=0.7, seed=rng)
+    _, best = swarm.run(scale["iterations"], instr)
+    return -best
+
+def run_gwo(objective, scale, seed, instr):
+    dim = scale["dim"]
+    optimizer = gwo.GreyWolfOptimizer(None, [-5] * dim, [5] * dim, dim, scale["pop"], scale["iterations"],
+                                      batch_obj_func=objective, instrumentation=instr, seed=seed)
+    return optimizer.optimize_vectorized()[1]
+
+# The cellular algorithm evolves scalar cells, so it runs the 1-D problem
+def run_cellular(objective, scale, seed, instr):
+    optimizer = cellular.CellularOptimizer((scale["grid"], scale["grid"]),
+                                           objective=lambda x: objective(x.reshape(-1, 1)), seed=seed)
+    return optimizer.run(scale["iterations"], instr)[1]
+
+def run_aco(cities, scale, seed, instr):
+    if len(cities) > 2000:
+        return aco.ant_colony_tsp_sparse(cities, scale["ants"], iterations=scale["aco_iterations"],
+                                         seed=seed, instrumentation=instr)[1]
+    return aco.ant_colony_tsp_vectorized(cities, scale["ants"], iterations=scale["aco_iterations"],
+                                         seed=seed, instrumentation=instr)[1]
+
+def run_cuckoo(instance, scale, seed, instr):
+    weights, values, capacity = instance
+    _, best = cuckoo.cuckoo_search_knapsack_vectorized(scale["pop"], 0.25, scale["iterations"], weights, values,
+                                                       capacity, seed=seed, instrumentation=instr)
+    return -best
+
+
+# Every case: (algorithm, problem name, problem builder, sign)
+# The builder returns (problem data, runner, target) for a scale and seed.
+def _continuous_case(run, name):
+    objective, target = CONTINUOUS[name]
+    return lambda scale, seed: (objective, run, target(1 if run is run_cellular else scale["dim"]))
+
+def _tsp_case(generator):
+    def build(scale, seed):
+        cities = generator(scale["cities"], np.random.default_rng(seed))
+        return cities, run_aco, nearest_neighbour_length(cities)
+    return build
+
+def _knapsack_case(scale, seed):
+    instance = knapsack_instance(scale["items"], np.random.default_rng(seed))
+    return instance, run_cuckoo, -greedy_knapsack_value(*instance)
+
+CASES = []
+for _alg, _run, _sign in (("ga", run_ga, -1), ("gea", run_gea, -1), ("pso", run_pso, -1),
+                          ("gwo", run_gwo, 1), ("cellular", run_cellular, 1)):
+    for _name in CONTINUOUS:
+        if _alg == "cellular" and _name == "rosenbrock":
+            continue    # Rosenbrock needs at least two dimensions
+        CASES.append((_alg, _name, _continuous_case(_run, _name), _sign))
+CASES.append(("aco", "tsp-uniform", _tsp_case(uniform_tsp), 1))
+CASES.append(("aco", "tsp-clustered", _tsp_case(clustered_tsp), 1))
+CASES.append(("cuckoo", "knapsack", _knapsack_case, -1))
+
+
+def run_case(build, sign, scale, seed):
+    problem, run, target = build(scale, seed)
+    reached = {}
+
+    def watch_target(instrumentation, best, info):
+        if "time" not in reached and sign * best <= target:
+            reached["time"] = time.perf_counter() - instrumentation.started
+
+    instr = Instrumentation(history_size=256, callbacks=[watch_target])
+    start = time.perf_counter()
+    best = run(problem, scale, seed, instr)
+    wall = time.perf_counter() - start
+
+    # Same seeded run again, traced, for the memory peak only
+    problem, run, _ = build(scale, seed)
+    tracemalloc.start()
+    run(problem, scale, seed, Instrumentation(history_size=256))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "best": float(best),
+        "target": float(target),
+        "wall_time": wall,
+        "evaluations": int(instr.evaluations),
+        "evaluations_per_second": float(instr.evaluations) / wall if wall > 0 else 0.0,
+        "time_to_target": reached.get("time"),
+        "peak_memory_mb": peak / 2**20,
+    }
+
+
+# --- Baselines ---
+# A metric regresses when it is worse than the baseline by more than
+# `tolerance` (relative) plus a small absolute floor that absorbs timer
+# and allocator noise on tiny cases. The evaluation rate is checked as the
+# wall time the new evaluation count would have taken at the baseline rate,
+# so it gets the same floor. Losing a target that the baseline reached also
+# counts as a regression.
+FLOORS = {"wall_time": 0.01, "time_to_target": 0.01, "peak_memory_mb": 0.5}
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for key, new in results.items():
+        old = baseline.get(key)
+        if old is None:
+            continue
+        if old["evaluations_per_second"] > 0:
+            expected_wall = new["evaluations"] / old["evaluations_per_second"]
+            if new["wall_time"] > expected_wall * (1 + tolerance) + FLOORS["wall_time"]:
+                regressions.append((key, "evaluations_per_second", old["evaluations_per_second"],
+                                    new["evaluations_per_second"]))
+        for metric in ("wall_time", "peak_memory_mb"):
+            if new[metric] > old[metric] * (1 + tolerance) + FLOORS[metric]:
+                regressions.append((key, metric, old[metric], new[metric]))
+        if old["time_to_target"] is not None:
+            limit = old["time_to_target"] * (1 + tolerance) + FLOORS["time_to_target"]
+            if new["time_to_target"] is None or new["time_to_target"] > limit:
+                regressions.append((key, "time_to_target", old["time_to_target"], new["time_to_target"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the lab optimizers.")
+    parser.add_argument("--scales", nargs="+", choices=list(SCALES), default=["small"])
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=ALGORITHMS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--repeat", type=int, help="keep the fastest of this many runs per case "
+                                                   "(default: 3 with --save or --baseline, else 1)")
+    args = parser.parse_args(argv)
+    repeat = args.repeat or (3 if args.save or args.baseline else 1)
+
+    results = {}
+    for scale_name in args.scales:
+        for alg, problem, build, sign in CASES:
+            if alg not in args.algorithms:
+                continue
+            key = f"{alg}/{problem}/{scale_name}"
+            r = min((run_case(build, sign, SCALES[scale_name], args.seed) for _ in range(repeat)),
+                    key=lambda result: result["wall_time"])
+            results[key] = r
+            ttt = "-" if r["time_to_target"] is None else f"{r['time_to_target']:.3f}s"
+            print(f"{key:32s} {r['wall_time']:9.3f}s {r['evaluations_per_second']:12.0f} evals/s "
+                  f"target {ttt:>9s} peak {r['peak_memory_mb']:8.1f} MB  best {r['best']:.6g}")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"python": platform.python_version(), "numpy": np.__version__,
+                       "machine": platform.machine(), "results": results}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        for key, metric, old, new in regressions:
+            print(f"REGRESSION {key} {metric}: {old} -> {new}")
+        if regressions:
+            return 1
+        print("No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+"""Bio-inspired optimization algorithms from the lab scripts, as a package.
+
+Every optimizer takes its configuration in the constructor and exposes the
+ask()/tell()/run() interface of bis_lab.base.Optimizer, so any number of runs
+with different settings can share one process.
+"""
+from .base import Optimizer
+from .termination import Termination
+from .evaluators import SerialEvaluator, ThreadEvaluator, ProcessEvaluator, make_evaluator
+from .steady_state import steady_state_evolution, run_steady_state
+from .checkpoint import save_checkpoint, load_checkpoint, rng_state, set_rng_state
+from .instrumentation import ConvergenceHistory, Instrumentation, NULL_INSTRUMENTATION, progress_printer
+from .genetic import GeneticOptimizer, PackedPopulation
+from .gene_expression import GeneExpressionOptimizer, RouletteSelector
+from .pso import ParticleSwarm
+from .aco import AntColonyOptimizer, TourLocalSearch
+from .cuckoo import CuckooSearchOptimizer
+from .gwo import GreyWolfOptimizer
+from .cellular import CellularOptimizer
+
+__all__ = [
+    "Optimizer", "Termination",
+    "SerialEvaluator", "ThreadEvaluator", "ProcessEvaluator", "make_evaluator",
+    "steady_state_evolution", "run_steady_state",
+    "save_checkpoint", "load_checkpoint", "rng_state", "set_rng_state",
+    "ConvergenceHistory", "Instrumentation", "NULL_INSTRUMENTATION", "progress_printer",
+    "GeneticOptimizer", "PackedPopulation",
+    "GeneExpressionOptimizer", "RouletteSelector",
+    "ParticleSwarm",
+    "AntColonyOptimizer", "TourLocalSearch",
+    "CuckooSearchOptimizer",
+    "GreyWolfOptimizer",
+    "CellularOptimizer",
+]
@@ -0,0 +1,619 @@
+import os
+import random
+import math
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from .base import Optimizer
+from .checkpoint import load_checkpoint, rng_state, save_checkpoint, set_rng_state
+from .instrumentation import NULL_INSTRUMENTATION
+
+# --- Helper Functions ---
+def distance(a, b):
+    return math.hypot(a[0] - b[0], a[1] - b[1])
+
+# --- Pheromone Store ---
+# Trails are kept as raw * scale. Evaporation only shrinks the scalar scale
+# (O(1)); a deposit of d is written as d / scale, so it reads back as d.
+# When scale falls below `renormalize_below`, it is folded into the raw
+# values once, which keeps raw from overflowing and scale from underflowing.
+# Optional MAX-MIN limits are applied lazily, when values are read, so the
+# raw trails themselves are never clipped.
+class PheromoneStore:
+    def __init__(self, shape, initial=1.0, tau_min=None, tau_max=None, renormalize_below=1e-100):
+        self.raw = np.full(shape, float(initial))
+        self.scale = 1.0
+        self.tau_min, self.tau_max = tau_min, tau_max
+        self.renormalize_below = renormalize_below
+
+    def evaporate(self, rho):
+        self.scale *= (1 - rho)
+        if self.scale < self.renormalize_below:
+            self.renormalize()
+
+    def renormalize(self):
+        self.raw *= self.scale
+        self.scale = 1.0
+
+    # Add `amounts` at `index` (any NumPy index; repeated entries accumulate)
+    def deposit(self, index, amounts):
+        np.add.at(self.raw, index, np.asarray(amounts, dtype=float) / self.scale)
+
+    def read(self, index=Ellipsis):
+        values = self.raw[index] * self.scale
+        if self.tau_min is not None or self.tau_max is not None:
+            values = np.clip(values, self.tau_min, self.tau_max)
+        return values
+
+    __getitem__ = read
+
+# --- Main ACO Function ---
+# With `checkpoint_path`, a snapshot is written every `checkpoint_every`
+# iterations. With resume=True an unfinished snapshot at the same path is
+# resumed from, provided it was written for the same cities and settings;
+# a finished one is ignored and the run starts over.
+def ant_colony_tsp(cities, ants=5, alpha=1, beta=2, rho=0.5, iterations=20, instrumentation=None,
+                   checkpoint_path=None, checkpoint_every=10, tau_min=None, tau_max=None, resume=False):
+    instr = instrumentation or NULL_INSTRUMENTATION
+    config = {"ants": ants, "alpha": alpha, "beta": beta, "rho": rho, "iterations": iterations,
+              "tau_min": tau_min, "tau_max": tau_max}
+    n = len(cities)
+    pheromone = PheromoneStore((n, n), 1, tau_min, tau_max)
+    dist = [[distance(cities[i], cities[j]) for j in range(n)] for i in range(n)]
+
+    best_route, best_distance = None, float('inf')
+    start = 0
+    if resume and checkpoint_path is not None and os.path.exists(checkpoint_path):
+        arrays, state = load_checkpoint(checkpoint_path)
+        if state["iteration"] < iterations:
+            if not np.array_equal(arrays["cities"], np.asarray(cities, dtype=float)):
+                raise ValueError(f"Checkpoint {checkpoint_path} was written for different cities")
+            if state["config"] != config:
+                raise ValueError(f"Checkpoint {checkpoint_path} was written with different settings")
+            set_rng_state(arrays, state)
+            pheromone.raw, pheromone.scale = arrays["pheromone"], state["pheromone_scale"]
+            best_route, best_distance, start = state["best_route"], state["best_distance"], state["iteration"]
+
+    for it in range(start, iterations):
+        instr.mark()
+        routes = []
+
+        for _ in range(ants):
+            route = [random.randint(0, n-1)]
+            while len(route) < n:
+                i = route[-1]
+                trail = pheromone[i].tolist()
+                probs = []
+                for j in range(n):
+                    if j not in route:
+                        tau = trail[j] ** alpha
+                        eta = (1 / dist[i][j]) ** beta
+                        probs.append((j, tau * eta))
+                next_city = random.choices([p[0] for p in probs], weights=[p[1] for p in probs])[0]
+                route.append(next_city)
+            routes.append(route)
+        instr.lap("construct")
+
+        # Length is computed once from the distance matrix and reused for deposit
+        all_routes = []
+        for route in routes:
+            L = sum(dist[route[i]][route[(i + 1) % n]] for i in range(n))
+            all_routes.append((route, L))
+
+            if L < best_distance:
+                best_distance, best_route = L, route
+        instr.count_evaluations(ants)
+        instr.lap("evaluate")
+
+        # Evaporate pheromone
+        pheromone.evaporate(rho)
+
+        # Add pheromone for best routes
+        for route, L in all_routes:
+            pheromone.deposit((route, route[1:] + route[:1]), 1 / L)
+
+        if checkpoint_path is not None and (it + 1) % checkpoint_every == 0:
+            arrays, state = rng_state()
+            arrays.update(cities=np.asarray(cities, dtype=float), pheromone=pheromone.raw)
+            state.update(best_route=best_route, best_distance=best_distance, iteration=it + 1,
+                         pheromone_scale=pheromone.scale, config=config)
+            save_checkpoint(checkpoint_path, arrays, state)
+        instr.lap("update")
+        instr.end_iteration(best_distance)
+
+    return best_route, best_distance
+
+# --- Vectorized Tour Construction ---
+def distance_matrix(cities):
+    xy = np.asarray(cities, dtype=float)
+    return np.hypot(xy[:, None, 0] - xy[None, :, 0], xy[:, None, 1] - xy[None, :, 1])
+
+# eta**beta with eta = 1/dist, computed once per run
+def heuristic_matrix(dist, beta):
+    with np.errstate(divide="ignore"):
+        eta = 1 / dist
+    eta[~np.isfinite(eta)] = 0      # diagonal (and duplicate cities)
+    return eta ** beta
+
+# All ants build their tours together. Each ant has a boolean visited row,
+# and every step draws the next city for all ants from their masked
+# choice-weight rows by inverse-CDF sampling.
+def construct_tours(weights, ants, rng):
+    n = len(weights)
+    tours = np.empty((ants, n), dtype=np.intp)
+    visited = np.zeros((ants, n), dtype=bool)
+    rows = np.arange(ants)
+
+    current = rng.integers(0, n, ants)
+    tours[:, 0] = current
+    visited[rows, current] = True
+    for step in range(1, n):
+        w = weights[current]
+        w[visited] = 0
+        cum = np.cumsum(w, axis=1)
+        pick = rng.random(ants) * cum[:, -1]
+        nxt = np.minimum((cum <= pick[:, None]).sum(axis=1), n - 1)
+        stuck = cum[:, -1] <= 0     # every remaining weight underflowed
+        if stuck.any():
+            nxt[stuck] = np.argmin(visited[stuck], axis=1)
+        current = nxt
+        tours[:, step] = current
+        visited[rows, current] = True
+    return tours
+
+def tour_lengths(dist, tours):
+    return dist[tours, np.roll(tours, -1, axis=1)].sum(axis=1)
+
+# local_search: None, "best" (iteration-best tour) or "all" (every tour);
+# tours are improved with TourLocalSearch before the deposit
+def ant_colony_tsp_vectorized(cities, ants=5, alpha=1, beta=2, rho=0.5, iterations=20, seed=None,
+                              instrumentation=None, local_search=None, local_search_k=8, tau_min=None,
+                              tau_max=None):
+    if local_search not in LOCAL_SEARCH_MODES:
+        raise ValueError(f"Unknown local search mode: {local_search}")
+    instr = instrumentation or NULL_INSTRUMENTATION
+    rng = np.random.default_rng(seed)
+    dist = distance_matrix(cities)
+    eta_beta = heuristic_matrix(dist, beta)
+    pheromone = PheromoneStore(dist.shape, 1, tau_min, tau_max)
+    search = TourLocalSearch(cities, local_search_k) if local_search else None
+
+    best_route, best_distance = None, float('inf')
+
+    for _ in range(iterations):
+        instr.mark()
+        weights = pheromone.read() ** alpha * eta_beta     # refreshed once per iteration
+        tours = construct_tours(weights, ants, rng)
+        instr.lap("construct")
+        lengths = tour_lengths(dist, tours)
+        instr.count_evaluations(ants)
+        instr.lap("evaluate")
+        improved = improve_tours(search, tours, lengths, local_search)
+        if improved:
+            lengths[improved] = tour_lengths(dist, tours[improved])
+            instr.lap("local_search")
+
+        k = int(np.argmin(lengths))
+        if lengths[k] < best_distance:
+            best_distance, best_route = float(lengths[k]), tours[k].tolist()
+
+        # Evaporate, then deposit 1/L on every edge of every tour
+        pheromone.evaporate(rho)
+        pheromone.deposit((tours, np.roll(tours, -1, axis=1)), (1 / lengths)[:, None])
+        instr.lap("update")
+        instr.end_iteration(best_distance)
+
+    return best_route, best_distance
+
+# Ask/tell form of the vectorized colony: ask() returns one (ants, n) batch
+# of tours, tell() evaporates and deposits 1/L for them
+class AntColonyOptimizer(Optimizer):
+    def __init__(self, cities, ants=5, alpha=1, beta=2, rho=0.5, objective=None, seed=None, tau_min=None,
+                 tau_max=None):
+        super().__init__(objective)
+        self.ants, self.alpha, self.rho = ants, alpha, rho
+        self.rng = np.random.default_rng(seed)
+        self.dist = distance_matrix(cities)
+        self.eta_beta = heuristic_matrix(self.dist, beta)
+        self.pheromone = PheromoneStore(self.dist.shape, 1, tau_min, tau_max)
+
+    def ask(self):
+        return construct_tours(self.pheromone.read() ** self.alpha * self.eta_beta, self.ants, self.rng)
+
+    def evaluate(self, candidates):
+        if self.objective is None:
+            return tour_lengths(self.dist, candidates)
+        return super().evaluate(candidates)
+
+    def tell(self, candidates, fitness):
+        lengths = np.asarray(fitness, dtype=float)
+        self.record_best(candidates, lengths)
+        self.pheromone.evaporate(self.rho)
+        self.pheromone.deposit((candidates, np.roll(candidates, -1, axis=1)), (1 / lengths)[:, None])
+
+# --- Sparse Mode for Large Instances ---
+# Uniform grid buckets: cities are hashed into square cells of about two
+# cities each, and the cities of cell c are order[starts[c]:starts[c + 1]].
+# Any city outside the cells within r of a city's own cell is at least
+# r * size away from it, which bounds the ring searches below.
+class CityGrid:
+    def __init__(self, xy):
+        self.xy = xy
+        self.side = max(1, int(math.sqrt(len(xy) / 2)))
+        lo = xy.min(axis=0)
+        self.size = max(np.ptp(xy, axis=0).max(), 1e-12) / self.side
+        cell = np.minimum(((xy - lo) / self.size).astype(np.intp), self.side - 1)
+        self.cell_id = cell[:, 0] * self.side + cell[:, 1]
+        self.order = np.argsort(self.cell_id, kind="stable")
+        self.starts = np.searchsorted(self.cell_id[self.order], np.arange(self.side * self.side + 1))
+
+    def _cells(self, x, y0, y1):
+        return self.order[self.starts[x * self.side + y0]:self.starts[x * self.side + y1 + 1]]
+
+    # Cities in the cells at most r cells away from cell (cx, cy)
+    def square(self, cx, cy, r):
+        y0, y1 = max(cy - r, 0), min(cy + r, self.side - 1)
+        return np.concatenate([self._cells(x, y0, y1)
+                               for x in range(max(cx - r, 0), min(cx + r, self.side - 1) + 1)])
+
+    # Cities in the cells exactly r cells away from cell (cx, cy)
+    def ring(self, cx, cy, r):
+        y0, y1 = max(cy - r, 0), min(cy + r, self.side - 1)
+        parts = []
+        for x in range(max(cx - r, 0), min(cx + r, self.side - 1) + 1):
+            if abs(x - cx) == r:
+                parts.append(self._cells(x, y0, y1))
+            else:
+                if cy - r >= 0:
+                    parts.append(self._cells(x, cy - r, cy - r))
+                if cy + r < self.side:
+                    parts.append(self._cells(x, cy + r, cy + r))
+        return np.concatenate(parts) if parts else self.order[:0]
+
+    # Nearest city with visited[city] False, searched ring by ring
+    def nearest_unvisited(self, city, visited):
+        cx, cy = divmod(int(self.cell_id[city]), self.side)
+        best, best_dist = -1, np.inf
+        for r in range(self.side):
+            found = self.ring(cx, cy, r)
+            found = found[~visited[found]]
+            if len(found):
+                d = np.hypot(self.xy[found, 0] - self.xy[city, 0], self.xy[found, 1] - self.xy[city, 1])
+                i = int(np.argmin(d))
+                if d[i] < best_dist:
+                    best, best_dist = int(found[i]), d[i]
+            if best_dist <= r * self.size:
+                break
+        return best
+
+# k nearest neighbours of every city from grid buckets: every cell widens
+# its search square until its k-th neighbour is provably inside it
+def nearest_neighbours(cities, k, grid=None):
+    xy = np.asarray(cities, dtype=float)
+    n = len(xy)
+    k = min(k, n - 1)
+    grid = grid or CityGrid(xy)
+    side = grid.side
+
+    neighbours = np.empty((n, k), dtype=np.intp)
+    neighbour_dist = np.empty((n, k))
+    for c in np.unique(grid.cell_id):
+        members = grid.order[grid.starts[c]:grid.starts[c + 1]]
+        cx, cy = divmod(c, side)
+        r = 1
+        while True:
+            found = grid.square(cx, cy, r)
+            whole_grid = cx - r <= 0 and cy - r <= 0 and cx + r >= side - 1 and cy + r >= side - 1
+            if len(found) > k:
+                d = np.hypot(xy[members, None, 0] - xy[found, 0], xy[members, None, 1] - xy[found, 1])
+                d[members[:, None] == found] = np.inf
+                idx = np.argpartition(d, k - 1, axis=1)[:, :k]
+                dk = np.take_along_axis(d, idx, axis=1)
+                # Anything outside the square is at least r cells away
+                if whole_grid or dk.max() <= r * grid.size:
+                    nearest = np.argsort(dk, axis=1)
+                    neighbours[members] = found[np.take_along_axis(idx, nearest, axis=1)]
+                    neighbour_dist[members] = np.take_along_axis(dk, nearest, axis=1)
+                    break
+            r += 1
+    return neighbours, neighbour_dist
+
+# Tour construction restricted to candidate edges. When every candidate of
+# the current city is visited, the ant moves to the nearest unvisited city,
+# found by a ring search over the grid buckets.
+def construct_tours_sparse(xy, candidates, weights, ants, rng, grid=None):
+    n, k = candidates.shape
+    grid = grid or CityGrid(xy)
+    tours = np.empty((ants, n), dtype=np.intp)
+    visited = np.zeros((ants, n), dtype=bool)
+    rows = np.arange(ants)
+
+    current = rng.integers(0, n, ants)
+    tours[:, 0] = current
+    visited[rows, current] = True
+    for step in range(1, n):
+        nb = candidates[current]
+        w = weights[current]
+        w[visited[rows[:, None], nb]] = 0
+        cum = np.cumsum(w, axis=1)
+        pick = rng.random(ants) * cum[:, -1]
+        nxt = nb[rows, np.minimum((cum <= pick[:, None]).sum(axis=1), k - 1)]
+        for a in np.flatnonzero(cum[:, -1] <= 0):
+            nxt[a] = grid.nearest_unvisited(current[a], visited[a])
+        current = nxt
+        tours[:, step] = current
+        visited[rows, current] = True
+    return tours
+
+def tour_lengths_from_coordinates(xy, tours):
+    step = xy[np.roll(tours, -1, axis=1)] - xy[tours]
+    return np.hypot(step[..., 0], step[..., 1]).sum(axis=1)
+
+# --- Local Search ---
+# 2-opt and Or-opt on an array tour: tour[i] is the i-th city and pos[c] the
+# index of city c, so successor and predecessor are O(1) lookups and a 2-opt
+# move reverses the shorter side of the cycle. Only edges to each city's k
+# nearest neighbours are tried, and every move is priced in O(1) from the
+# coordinates. Don't-look bits: a queue holds the cities whose surroundings
+# changed; a city without an improving move leaves it until a later move
+# touches one of its tour edges.
+LOCAL_SEARCH_MODES = (None, "best", "all")
+LOCAL_SEARCH_EPS = 1e-10
+
+class TourLocalSearch:
+    def __init__(self, cities, k=8, moves=("2-opt", "or-opt"), max_segment=3, neighbours=None):
+        xy = np.asarray(cities, dtype=float)
+        self.x, self.y = xy[:, 0].tolist(), xy[:, 1].tolist()
+        if neighbours is None:
+            neighbours = nearest_neighbours(xy, k)[0]
+        self.neighbours = np.asarray(neighbours)[:, :k].tolist()
+        self.two_opt = "2-opt" in moves
+        self.or_opt = "or-opt" in moves
+        self.max_segment = max_segment
+
+    def dist(self, a, b):
+        return math.hypot(self.x[a] - self.x[b], self.y[a] - self.y[b])
+
+    def succ(self, c):
+        return self.tour[(self.pos[c] + 1) % len(self.tour)]
+
+    def pred(self, c):
+        return self.tour[self.pos[c] - 1]
+
+    # Reverse tour[i..j] (cyclic, inclusive); the complement is reversed
+    # instead when it is shorter, which gives the same cycle
+    def reverse(self, i, j):
+        tour, pos = self.tour, self.pos
+        n = len(tour)
+        length = (j - i) % n + 1
+        if 2 * length > n:
+            i, j = (j + 1) % n, (i - 1) % n
+            length = n - length
+        for _ in range(length // 2):
+            a, b = tour[i], tour[j]
+            tour[i], pos[b] = b, i
+            tour[j], pos[a] = a, j
+            i = i + 1 if i + 1 < n else 0
+            j = j - 1 if j > 0 else n - 1
+
+    # Replace tour edges (a, b) and (c, d) by (a, c) and (b, d); b and d
+    # must both follow (or both precede) a and c
+    def move(self, a, b, c, d):
+        if self.succ(a) == b:
+            self.reverse(self.pos[b], self.pos[c])
+        else:
+            self.reverse(self.pos[a], self.pos[d])
+
+    def try_2opt(self, a):
+        dist = self.dist
+        for forward in (True, False):
+            b = self.succ(a) if forward else self.pred(a)
+            d_ab = dist(a, b)
+            for c in self.neighbours[a]:
+                d_ac = dist(a, c)
+                if d_ac >= d_ab:
+                    break
+                d = self.succ(c) if forward else self.pred(c)
+                if c == b or d == a:
+                    continue
+                if d_ac + dist(b, d) - d_ab - dist(c, d) < -LOCAL_SEARCH_EPS:
+                    self.move(a, b, c, d)
+                    return (a, b, c, d)
+        return None
+
+    # Move a segment of up to max_segment cities that starts or ends at a
+    # between two adjacent cities x, y near one of its ends, in either
+    # orientation. Done as two 2-opt moves (reversed segment) or three.
+    def try_or_opt(self, a):
+        dist = self.dist
+        n = len(self.tour)
+        for length in range(1, min(self.max_segment, n - 4) + 1):
+            for first_at_a in (True, False):
+                f = l = a
+                for _ in range(length - 1):
+                    if first_at_a:
+                        l = self.succ(l)
+                    else:
+                        f = self.pred(f)
+                segment = {self.tour[(self.pos[f] + i) % n] for i in range(length)}
+                p0, p1 = self.pred(f), self.succ(l)
+                gain = dist(p0, f) + dist(l, p1) - dist(p0, p1)
+                if gain <= LOCAL_SEARCH_EPS:
+                    continue
+                for end in (f, l):
+                    for c in self.neighbours[end]:
+                        if dist(end, c) >= gain:
+                            break
+                        if c in segment:
+                            continue
+                        for x, y in ((c, self.succ(c)), (self.pred(c), c)):
+                            if x in segment or y in segment or x == p1 or y == p0:
+                                continue
+                            d_xy = dist(x, y)
+                            straight = dist(x, f) + dist(l, y) - d_xy
+                            reverse = dist(x, l) + dist(f, y) - d_xy
+                            if min(straight, reverse) - gain < -LOCAL_SEARCH_EPS:
+                                self.move(p0, f, x, y)
+                                self.move(p0, x, p1, l)
+                                if straight < reverse:
+                                    self.move(x, l, f, y)
+                                return (p0, p1, f, l, x, y)
+        return None
+
+    # Improved copy of one tour
+    def improve(self, tour):
+        self.tour = [int(c) for c in tour]
+        n = len(self.tour)
+        if n < 8:
+            return np.array(self.tour, dtype=np.intp)
+        self.pos = [0] * n
+        for i, c in enumerate(self.tour):
+            self.pos[c] = i
+        queue = deque(self.tour)
+        active = [True] * n
+        while queue:
+            a = queue.popleft()
+            active[a] = False
+            touched = (self.two_opt and self.try_2opt(a)) or (self.or_opt and self.try_or_opt(a))
+            if touched:
+                for c in touched:
+                    if not active[c]:
+                        active[c] = True
+                        queue.append(c)
+        return np.array(self.tour, dtype=np.intp)
+
+# Local search on every tour ("all") or on the iteration-best one ("best"),
+# in place; returns the indices of the tours that were searched
+def improve_tours(search, tours, lengths, mode):
+    if mode is None:
+        return []
+    chosen = range(len(tours)) if mode == "all" else [int(np.argmin(lengths))]
+    for i in chosen:
+        tours[i] = search.improve(tours[i])
+    return list(chosen)
+
+# Memory-bounded ACO: pheromone lives only on the n*k candidate edges and
+# no n x n matrix is ever allocated
+def ant_colony_tsp_sparse(cities, ants=5, alpha=1, beta=2, rho=0.5, iterations=20, k=10, seed=None,
+                          instrumentation=None, local_search=None, local_search_k=8, tau_min=None, tau_max=None):
+    if local_search not in LOCAL_SEARCH_MODES:
+        raise ValueError(f"Unknown local search mode: {local_search}")
+    instr = instrumentation or NULL_INSTRUMENTATION
+    rng = np.random.default_rng(seed)
+    xy = np.asarray(cities, dtype=float)
+    n = len(xy)
+    grid = CityGrid(xy)
+    candidates, candidate_dist = nearest_neighbours(xy, k, grid)
+    search = TourLocalSearch(xy, local_search_k, neighbours=candidates) if local_search else None
+    eta_beta = (1 / np.maximum(candidate_dist, 1e-12)) ** beta
+    pheromone = PheromoneStore(candidates.shape, 1, tau_min, tau_max)
+
+    best_route, best_distance = None, float('inf')
+
+    for _ in range(iterations):
+        instr.mark()
+        weights = pheromone.read() ** alpha * eta_beta
+        tours = construct_tours_sparse(xy, candidates, weights, ants, rng, grid)
+        instr.lap("construct")
+        lengths = tour_lengths_from_coordinates(xy, tours)      # once per route
+        instr.count_evaluations(ants)
+        instr.lap("evaluate")
+        improved = improve_tours(search, tours, lengths, local_search)
+        if improved:
+            lengths[improved] = tour_lengths_from_coordinates(xy, tours[improved])
+            instr.lap("local_search")
+
+        best = int(np.argmin(lengths))
+        if lengths[best] < best_distance:
+            best_distance, best_route = float(lengths[best]), tours[best].tolist()
+
+        # Evaporate, then deposit 1/L on the tour edges that are candidate edges
+        pheromone.evaporate(rho)
+        a = tours.ravel()
+        b = np.roll(tours, -1, axis=1).ravel()
+        hit = candidates[a] == b[:, None]
+        on_graph = hit.any(axis=1)
+        pheromone.deposit((a[on_graph], hit[on_graph].argmax(axis=1)), np.repeat(1 / lengths, n)[on_graph])
+        instr.lap("update")
+        instr.end_iteration(best_distance)
+
+    return best_route, best_distance
+
+# --- Process-Parallel Construction ---
+# Choice weights tau**alpha * eta**beta computed only for the rows the ants
+# are standing on, straight from the shared matrices
+class _ChoiceWeights:
+    def __init__(self, pheromone, eta_beta, alpha):
+        self.pheromone, self.eta_beta, self.alpha = pheromone, eta_beta, alpha
+
+    def __len__(self):
+        return len(self.eta_beta)
+
+    def __getitem__(self, rows):
+        return self.pheromone[rows] ** self.alpha * self.eta_beta[rows]
+
+# Worker-side views of the shared matrices, attached once per process
+_shared_blocks = []
+_shared_arrays = {}
+
+def _attach_shared(names, n, alpha):
+    for key, name in names.items():
+        shm = shared_memory.SharedMemory(name=name)
+        _shared_blocks.append(shm)
+        _shared_arrays[key] = np.ndarray((n, n), dtype=np.float64, buffer=shm.buf)
+    _shared_arrays["alpha"] = alpha
+
+def _construct_chunk(ants, seed):
+    a = _shared_arrays
+    weights = _ChoiceWeights(a["pheromone"], a["eta_beta"], a["alpha"])
+    return construct_tours(weights, ants, np.random.default_rng(seed))
+
+# Ants are split into one fixed group per worker. The distance, eta**beta
+# and pheromone matrices live in shared memory, so tasks only carry a group
+# size and a seed, and only tours come back. Every group
+# gets its own SeedSequence child of the run seed, so a run is reproducible
+# for a given (seed, workers).
+def ant_colony_tsp_parallel(cities, ants=5, alpha=1, beta=2, rho=0.5, iterations=20, workers=None, seed=None,
+                            instrumentation=None):
+    instr = instrumentation or NULL_INSTRUMENTATION
+    xy = np.asarray(cities, dtype=float)
+    n = len(xy)
+    groups = [len(g) for g in np.array_split(np.arange(ants), min(workers or os.cpu_count(), ants))]
+
+    blocks = {key: shared_memory.SharedMemory(create=True, size=n * n * 8)
+              for key in ("dist", "eta_beta", "pheromone")}
+    arrays = {key: np.ndarray((n, n), dtype=np.float64, buffer=shm.buf) for key, shm in blocks.items()}
+    try:
+        arrays["dist"][:] = distance_matrix(xy)
+        arrays["eta_beta"][:] = heuristic_matrix(arrays["dist"], beta)
+        arrays["pheromone"].fill(1)
+        pheromone = arrays["pheromone"]
+
+        best_route, best_distance = None, float('inf')
+        root = np.random.SeedSequence(seed)
+        names = {key: shm.name for key, shm in blocks.items()}
+        with ProcessPoolExecutor(len(groups), initializer=_attach_shared, initargs=(names, n, alpha)) as pool:
+            for _ in range(iterations):
+                instr.mark()
+                tours = np.concatenate(list(pool.map(_construct_chunk, groups, root.spawn(len(groups)))))
+                instr.lap("construct")
+
+                lengths = tour_lengths(arrays["dist"], tours)
+                k = int(np.argmin(lengths))
+                if lengths[k] < best_distance:
+                    best_distance, best_route = float(lengths[k]), tours[k].tolist()
+                instr.count_evaluations(ants)
+                instr.lap("evaluate")
+
+                pheromone *= (1 - rho)
+                np.add.at(pheromone, (tours, np.roll(tours, -1, axis=1)), (1 / lengths)[:, None])
+                instr.lap("update")
+                instr.end_iteration(best_distance)
+        return best_route, best_distance
+    finally:
+        pheromone = None
+        arrays.clear()      # drop buffer views before closing the blocks
+        for shm in blocks.values():
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,75 @@
+import numpy as np
+
+from .instrumentation import NULL_INSTRUMENTATION
+
+# ---------------------------------------------------------------
+# Common ask/tell interface
+# ---------------------------------------------------------------
+# All configuration goes to the constructor and all run state lives on the
+# instance, so any number of optimizers can be created and run back to back
+# in one process. A driver either calls run(), or loops itself:
+#
+#   batch = opt.ask()                  # candidates to evaluate
+#   opt.tell(batch, my_fitness(batch)) # one fitness value per candidate
+#
+# `maximize` says which direction is better for the fitness values given
+# to tell(); best_solution/best_fitness hold the best candidate told so far.
+class Optimizer:
+    maximize = False
+
+    def __init__(self, objective=None):
+        self.objective = objective          # batched: candidates -> fitness array
+        self.best_solution = None
+        self.best_fitness = float('-inf') if self.maximize else float('inf')
+
+    def ask(self):
+        raise NotImplementedError
+
+    def tell(self, candidates, fitness):
+        raise NotImplementedError
+
+    def evaluate(self, candidates):
+        return np.asarray(self.objective(candidates))
+
+    def is_better(self, a, b):
+        return a > b if self.maximize else a < b
+
+    # Update best_solution/best_fitness from one told batch
+    def record_best(self, candidates, fitness):
+        i = int(np.argmax(fitness) if self.maximize else np.argmin(fitness))
+        if self.is_better(fitness[i], self.best_fitness):
+            solution = candidates[i]
+            self.best_solution = solution.copy() if isinstance(solution, np.ndarray) else solution
+            self.best_fitness = fitness[i]
+
+    def step(self):
+        candidates = self.ask()
+        fitness = self.evaluate(candidates)
+        self.tell(candidates, fitness)
+        return fitness
+
+    # Runs `iterations` iterations, or until `termination` (a
+    # bis_lab.termination.Termination) stops it, whichever comes first
+    def run(self, iterations=None, instrumentation=None, termination=None):
+        if iterations is None and termination is None:
+            raise ValueError("run() needs an iteration count or a termination rule")
+        instr = instrumentation or NULL_INSTRUMENTATION
+        if termination is not None:
+            termination.start(self.maximize)
+        done = 0
+        while iterations is None or done < iterations:
+            if termination is not None and not termination.should_continue():
+                break
+            instr.mark()
+            candidates = self.ask()
+            instr.lap("update")
+            fitness = self.evaluate(candidates)
+            instr.count_evaluations(len(fitness))
+            instr.lap("evaluate")
+            self.tell(candidates, fitness)
+            instr.lap("update")
+            instr.end_iteration(self.best_fitness)
+            if termination is not None:
+                termination.update(self.best_fitness, len(fitness))
+            done += 1
+        return self.best_solution, self.best_fitness
@@ -0,0 +1,295 @@
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from .base import Optimizer
+from .instrumentation import NULL_INSTRUMENTATION
+
+# ---------------------------
+# Step 1: Define the Problem
+# ---------------------------
+def objective_function(x):
+    # Function: f(x) = x^2 - 4x + 4
+    return x**2 - 4*x + 4
+
+# ---------------------------
+# Step 2: Initialize Parameters
+# ---------------------------
+GRID_SIZE = (10, 10)      # 10x10 grid
+NUM_ITERATIONS = 100      # Number of iterations
+SEARCH_SPACE = (-10, 10)  # Range for x
+NEIGHBORHOOD_RADIUS = 1   # 3x3 neighborhood
+
+# ---------------------------
+# Step 3: Initialize Population
+# ---------------------------
+def initialize_grid(grid_size, bounds):
+    grid = np.random.uniform(bounds[0], bounds[1], size=grid_size)
+    return grid
+
+# ---------------------------
+# Step 4: Evaluate Fitness
+# ---------------------------
+def evaluate_fitness(grid):
+    return objective_function(grid)
+
+# ---------------------------
+# Step 5: Update Cell States
+# ---------------------------
+def update_grid(grid, fitness):
+    new_grid = np.copy(grid)
+    rows, cols = grid.shape
+
+    for i in range(rows):
+        for j in range(cols):
+            # Get neighborhood indices
+            neighborhood = []
+            for dx in range(-NEIGHBORHOOD_RADIUS, NEIGHBORHOOD_RADIUS + 1):
+                for dy in range(-NEIGHBORHOOD_RADIUS, NEIGHBORHOOD_RADIUS + 1):
+                    ni = (i + dx) % rows  # Wrap around (toroidal)
+                    nj = (j + dy) % cols
+                    neighborhood.append(grid[ni, nj])
+            
+            # Update rule: average of neighbors
+            new_value = np.mean(neighborhood)
+            
+            # Optional: add small random mutation
+            mutation = np.random.uniform(-0.1, 0.1)
+            new_value += mutation
+            
+            # Clip within search space
+            new_value = np.clip(new_value, SEARCH_SPACE[0], SEARCH_SPACE[1])
+            new_grid[i, j] = new_value
+
+    return new_grid
+
+# ---------------------------
+# Step 5b: Vectorized Update
+# ---------------------------
+# Mean of the (2r+1)x(2r+1) window around every cell of an array that
+# already carries r cells of halo on each side. Window sums come from a
+# summed-area table, so the cost per cell does not depend on the radius.
+def window_mean(padded, radius):
+    k = 2 * radius + 1
+    sat = np.zeros((padded.shape[0] + 1, padded.shape[1] + 1))
+    np.cumsum(np.cumsum(padded, axis=0), axis=1, out=sat[1:, 1:])
+    sums = sat[k:, k:] - sat[:-k, k:] - sat[k:, :-k] + sat[:-k, :-k]
+    return sums / (k * k)
+
+# Toroidal neighbourhood mean of the whole grid
+def neighborhood_mean(grid, radius=NEIGHBORHOOD_RADIUS):
+    return window_mean(np.pad(grid, radius, mode="wrap"), radius)
+
+# Same rule as update_grid: neighbourhood mean, mutation noise and clipping
+# applied to the whole grid at once
+def update_grid_vectorized(grid, fitness=None, radius=NEIGHBORHOOD_RADIUS, rng=np.random,
+                           bounds=SEARCH_SPACE):
+    new_grid = neighborhood_mean(grid, radius)
+    new_grid += rng.uniform(-0.1, 0.1, size=grid.shape)
+    np.clip(new_grid, bounds[0], bounds[1], out=new_grid)
+    return new_grid
+
+# ---------------------------
+# Step 6: Main Algorithm Loop
+# ---------------------------
+def parallel_cellular_algorithm(update=update_grid, instrumentation=None):
+    instr = instrumentation or NULL_INSTRUMENTATION
+    grid = initialize_grid(GRID_SIZE, SEARCH_SPACE)
+    best_solution = None
+    best_fitness = float('inf')
+
+    for iteration in range(NUM_ITERATIONS):
+        instr.mark()
+        fitness = evaluate_fitness(grid)
+        instr.count_evaluations(grid.size)
+        
+        # Find current best
+        min_idx = np.unravel_index(np.argmin(fitness), fitness.shape)
+        current_best = grid[min_idx]
+        current_fitness = fitness[min_idx]
+
+        if current_fitness < best_fitness:
+            best_solution = current_best
+            best_fitness = current_fitness
+        instr.lap("evaluate")
+
+        # Update all cells
+        grid = update(grid, fitness)
+        instr.lap("update")
+        instr.end_iteration(best_fitness)
+
+    return best_solution, best_fitness
+
+# ---------------------------
+# Step 6a: Ask/Tell Interface
+# ---------------------------
+# Grid size, bounds and objective are per instance instead of the module
+# globals above. ask() hands out every cell as one flat batch.
+class CellularOptimizer(Optimizer):
+    def __init__(self, grid_size=GRID_SIZE, bounds=SEARCH_SPACE, radius=NEIGHBORHOOD_RADIUS,
+                 objective=objective_function, seed=None):
+        super().__init__(objective)
+        self.bounds = bounds
+        self.radius = radius
+        self.rng = np.random.default_rng(seed)
+        self.grid = self.rng.uniform(bounds[0], bounds[1], size=grid_size)
+
+    def ask(self):
+        return self.grid.reshape(-1)
+
+    def tell(self, candidates, fitness):
+        self.record_best(candidates, np.asarray(fitness))
+        self.grid = update_grid_vectorized(candidates.reshape(self.grid.shape), radius=self.radius,
+                                           rng=self.rng, bounds=self.bounds)
+
+# ---------------------------
+# Step 6b: Multi-Core Execution
+# ---------------------------
+# Worker-side view of the shared double buffer, attached once per process
+_tile_state = {}
+
+def _attach_grid(name, shape, radius):
+    shm = shared_memory.SharedMemory(name=name)
+    _tile_state["shm"] = shm
+    _tile_state["buffers"] = np.ndarray((2,) + shape, dtype=np.float64, buffer=shm.buf)
+    _tile_state["radius"] = radius
+
+# Tile plus a halo of width radius, wrapping around the torus. Along an
+# axis that stays inside the grid this is a plain slice, so interior tiles
+# are read in place; only the edge tiles gather their wrapped halo.
+def _tile_with_halo(src, tile, radius):
+    index = []
+    for (start, stop), size in zip(tile, src.shape):
+        start, stop = start - radius, stop + radius
+        index.append(slice(start, stop) if start >= 0 and stop <= size else np.arange(start, stop) % size)
+    if isinstance(index[0], slice) or isinstance(index[1], slice):
+        return src[index[0], index[1]]
+    return src[np.ix_(index[0], index[1])]
+
+# Fitness of one tile of the current buffer; returns the tile's best cell
+def _evaluate_tile(tile, current):
+    (r0, r1), (c0, c1) = tile
+    cells = _tile_state["buffers"][current, r0:r1, c0:c1]
+    fitness = evaluate_fitness(cells)
+    best = np.unravel_index(np.argmin(fitness), fitness.shape)
+    return fitness[best], cells[best]
+
+# One tile step: read the tile and its halo from the current buffer and
+# write the updated tile into the other buffer. The noise comes from the
+# tile's own seed and the iteration number.
+def _update_tile(tile, current, seed, iteration):
+    (r0, r1), (c0, c1) = tile
+    radius = _tile_state["radius"]
+    padded = _tile_with_halo(_tile_state["buffers"][current], tile, radius)
+    new_tile = window_mean(padded, radius)
+    new_tile += np.random.default_rng([seed, iteration]).uniform(-0.1, 0.1, size=new_tile.shape)
+    np.clip(new_tile, SEARCH_SPACE[0], SEARCH_SPACE[1], out=new_tile)
+    _tile_state["buffers"][1 - current, r0:r1, c0:c1] = new_tile
+
+# The grid is split into tiles handled by a process pool. Both generations
+# live in one shared-memory double buffer, so workers exchange nothing but
+# the halo cells they read from their neighbours' tiles. Each iteration
+# evaluates all tiles, then updates all tiles; the global best is a
+# reduction over the per-tile bests.
+def parallel_cellular_algorithm_multicore(grid_size=GRID_SIZE, num_iterations=NUM_ITERATIONS,
+                                          radius=NEIGHBORHOOD_RADIUS, workers=None, tiles=None, seed=None,
+                                          instrumentation=None):
+    instr = instrumentation or NULL_INSTRUMENTATION
+    workers = workers or os.cpu_count()
+    rows, cols = grid_size
+    tiles = tiles or (min(workers, rows), 1)
+    if not (1 <= tiles[0] <= rows and 1 <= tiles[1] <= cols):
+        raise ValueError(f"Cannot split a {rows}x{cols} grid into {tiles[0]}x{tiles[1]} non-empty tiles")
+    row_edges = np.linspace(0, rows, tiles[0] + 1).astype(int)
+    col_edges = np.linspace(0, cols, tiles[1] + 1).astype(int)
+    tile_list = [((row_edges[a], row_edges[a + 1]), (col_edges[b], col_edges[b + 1]))
+                 for a in range(tiles[0]) for b in range(tiles[1])]
+
+    root = np.random.SeedSequence(seed)
+    tile_seeds = [int(child.generate_state(1, np.uint64)[0]) for child in root.spawn(len(tile_list))]
+    shm = shared_memory.SharedMemory(create=True, size=2 * rows * cols * 8)
+    buffers = np.ndarray((2, rows, cols), dtype=np.float64, buffer=shm.buf)
+    try:
+        buffers[0] = np.random.default_rng(root.spawn(1)[0]).uniform(SEARCH_SPACE[0], SEARCH_SPACE[1], size=grid_size)
+        best_solution = None
+        best_fitness = float('inf')
+
+        current = 0
+        with ProcessPoolExecutor(workers, initializer=_attach_grid, initargs=(shm.name, (rows, cols), radius)) as pool:
+            for iteration in range(num_iterations):
+                instr.mark()
+                n = len(tile_list)
+                results = list(pool.map(_evaluate_tile, tile_list, [current] * n))
+                current_fitness, current_best = min(results, key=lambda r: r[0])
+
+                if current_fitness < best_fitness:
+                    best_solution = current_best
+                    best_fitness = current_fitness
+                instr.count_evaluations(rows * cols)
+                instr.lap("evaluate")
+
+                list(pool.map(_update_tile, tile_list, [current] * n, tile_seeds, [iteration] * n))
+                current = 1 - current
+                instr.lap("update")
+                instr.end_iteration(best_fitness)
+
+        return best_solution, best_fitness
+    finally:
+        buffers = None      # drop the buffer view before closing the block
+        shm.close()
+        shm.unlink()
+
+# ---------------------------
+# Step 6c: Out-of-Core Execution
+# ---------------------------
+# Current and next grids are np.memmap files. Each iteration streams
+# through them in bands of band_rows rows, reading radius extra rows above
+# and below every band, so resident memory depends on the band size and
+# not on the grid size. The best cell is tracked band by band.
+def parallel_cellular_algorithm_out_of_core(grid_size=GRID_SIZE, num_iterations=NUM_ITERATIONS,
+                                            radius=NEIGHBORHOOD_RADIUS, band_rows=256,
+                                            directory=None, seed=None, instrumentation=None):
+    instr = instrumentation or NULL_INSTRUMENTATION
+    rows, cols = grid_size
+    rng = np.random.default_rng(seed)
+    workdir = tempfile.TemporaryDirectory(dir=directory)
+    try:
+        grids = [np.memmap(os.path.join(workdir.name, f"grid{k}.dat"), dtype=np.float64,
+                           mode="w+", shape=grid_size) for k in range(2)]
+        for r0 in range(0, rows, band_rows):
+            r1 = min(r0 + band_rows, rows)
+            grids[0][r0:r1] = rng.uniform(SEARCH_SPACE[0], SEARCH_SPACE[1], size=(r1 - r0, cols))
+
+        best_solution = None
+        best_fitness = float('inf')
+
+        for iteration in range(num_iterations):
+            instr.mark()
+            src, dst = grids[iteration % 2], grids[1 - iteration % 2]
+            for r0 in range(0, rows, band_rows):
+                r1 = min(r0 + band_rows, rows)
+                band = src[np.arange(r0 - radius, r1 + radius) % rows]
+                padded = np.pad(band, ((0, 0), (radius, radius)), mode="wrap")
+                instr.lap("update")
+
+                fitness = evaluate_fitness(band[radius:radius + r1 - r0])
+                i, j = np.unravel_index(np.argmin(fitness), fitness.shape)
+                if fitness[i, j] < best_fitness:
+                    best_fitness = fitness[i, j]
+                    best_solution = band[radius + i, j]
+                instr.lap("evaluate")
+
+                new_band = window_mean(padded, radius)
+                new_band += rng.uniform(-0.1, 0.1, size=new_band.shape)
+                np.clip(new_band, SEARCH_SPACE[0], SEARCH_SPACE[1], out=new_band)
+                dst[r0:r1] = new_band
+            dst.flush()
+            instr.count_evaluations(rows * cols)
+            instr.lap("update")
+            instr.end_iteration(best_fitness)
+
+        return best_solution, best_fitness
+    finally:
+        grids = None        # release the mappings before the files are removed
+        workdir.cleanup()
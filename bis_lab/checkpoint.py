@@ -0,0 +1,57 @@
+import json
+import os
+import random
+import numpy as np
+
+# ---------------------------------------------------------------
+# Checkpoint / resume
+# ---------------------------------------------------------------
+# A snapshot is one uncompressed .npz file: arrays are stored as raw
+# buffers, and everything else (scalars, RNG states) as a single JSON
+# string. The file is written next to its final path and moved into place
+# with os.replace, so a job killed mid-write leaves the previous snapshot
+# intact.
+#
+# rng_state()/set_rng_state() capture everything a run draws from: the
+# global `random` and `np.random` streams plus an optional own generator
+# (np.random.Generator or RandomState), so a resumed run continues the
+# exact same trajectory.
+def save_checkpoint(path, arrays, state):
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        np.savez(f, __state__=np.array(json.dumps(state)), **arrays)
+    os.replace(tmp, path)
+
+def load_checkpoint(path):
+    with np.load(path) as data:
+        arrays = {key: data[key] for key in data.files if key != "__state__"}
+        state = json.loads(str(data["__state__"]))
+    return arrays, state
+
+# RandomState.get_state() as (JSON part, key array)
+def _legacy_state(random_state):
+    name, keys, pos, has_gauss, cached = random_state.get_state()
+    return {"name": name, "pos": int(pos), "has_gauss": int(has_gauss), "cached": float(cached)}, keys
+
+def _set_legacy_state(random_state, state, keys):
+    random_state.set_state((state["name"], keys, state["pos"], state["has_gauss"], state["cached"]))
+
+def rng_state(rng=None):
+    version, internal, gauss = random.getstate()
+    numpy_state, numpy_keys = _legacy_state(np.random)
+    state = {"random": [version, list(internal), gauss], "numpy": numpy_state}
+    arrays = {"rng_numpy_keys": numpy_keys}
+    if isinstance(rng, np.random.Generator):
+        state["generator"] = rng.bit_generator.state
+    elif isinstance(rng, np.random.RandomState):
+        state["random_state"], arrays["rng_own_keys"] = _legacy_state(rng)
+    return arrays, state
+
+def set_rng_state(arrays, state, rng=None):
+    version, internal, gauss = state["random"]
+    random.setstate((version, tuple(internal), gauss))
+    _set_legacy_state(np.random, state["numpy"], arrays["rng_numpy_keys"])
+    if "generator" in state:
+        rng.bit_generator.state = state["generator"]
+    elif "random_state" in state:
+        _set_legacy_state(rng, state["random_state"], arrays["rng_own_keys"])
@@ -0,0 +1,403 @@
+import numpy as np
+import math
+from functools import lru_cache, partial
+from .base import Optimizer
+from .evaluators import SerialEvaluator
+from .instrumentation import NULL_INSTRUMENTATION
+
+# Problem data (example)
+weights = np.array([10, 20, 30, 40, 15])
+values = np.array([60, 100, 120, 240, 70])
+W = 50  # knapsack capacity
+num_items = len(weights)
+
+def fitness(solution):
+    total_weight = np.sum(solution * weights)
+    total_value = np.sum(solution * values)
+    if total_weight > W:
+        return 0  # penalize infeasible solutions
+    else:
+        return total_value
+
+# Mantegna's sigma only depends on Lambda, so it is computed once per value
+@lru_cache(maxsize=None)
+def levy_sigma(Lambda=1.5):
+    return (math.gamma(1 + Lambda) * math.sin(math.pi * Lambda / 2) /
+            (math.gamma((1 + Lambda) / 2) * Lambda * 2 ** ((Lambda - 1) / 2))) ** (1 / Lambda)
+
+def levy_flight(Lambda=1.5, dim=num_items):
+    sigma1 = levy_sigma(Lambda)
+    sigma2 = 1
+    u = np.random.normal(0, sigma1, size=dim)
+    v = np.random.normal(0, sigma2, size=dim)
+    step = u / abs(v) ** (1 / Lambda)
+    return step
+
+def sigmoid(x):
+    return 1 / (1 + np.exp(-x))
+
+# Candidates are generated nest by nest as before, then scored as one batch
+# by `evaluator` (bis_lab.evaluators; serial by default)
+def cuckoo_search_knapsack(n=20, Pa=0.25, max_iter=500, instrumentation=None, evaluator=None):
+    instr = instrumentation or NULL_INSTRUMENTATION
+    evaluate = evaluator or SerialEvaluator(fitness)
+    # Initialize nests randomly with binary vectors
+    nests = np.random.randint(2, size=(n, num_items))
+    fitness_vals = evaluate(nests)
+
+    best_idx = np.argmax(fitness_vals)
+    best_nest = nests[best_idx].copy()
+    best_fitness = fitness_vals[best_idx]
+
+    for t in range(max_iter):
+        instr.mark()
+        new_solutions = np.empty_like(nests)
+        for i in range(n):
+            # Generate new solution by Levy flight
+            step = levy_flight()
+            new_solution_continuous = nests[i] + step
+            probs = sigmoid(new_solution_continuous)
+            new_solutions[i] = np.where(np.random.rand(num_items) < probs, 1, 0)
+        instr.lap("update")
+
+        new_fitness = evaluate(new_solutions)
+        instr.lap("evaluate")
+
+        for i in range(n):
+            if new_fitness[i] > fitness_vals[i]:
+                nests[i] = new_solutions[i]
+                fitness_vals[i] = new_fitness[i]
+
+                if new_fitness[i] > best_fitness:
+                    best_fitness = new_fitness[i]
+                    best_nest = new_solutions[i].copy()
+
+        # Abandon fraction Pa of worst nests and replace with new random solutions
+        abandon_indices = np.where(np.random.rand(n) < Pa)[0]
+        for idx in abandon_indices:
+            nests[idx] = np.random.randint(2, size=num_items)
+        if len(abandon_indices):
+            instr.lap("update")
+            fitness_vals[abandon_indices] = evaluate(nests[abandon_indices])
+            instr.lap("evaluate")
+
+        for idx in abandon_indices:
+            if fitness_vals[idx] > best_fitness:
+                best_fitness = fitness_vals[idx]
+                best_nest = nests[idx].copy()
+        instr.count_evaluations(n + len(abandon_indices))
+        instr.lap("update")
+        instr.end_iteration(best_fitness)
+
+    return best_nest, best_fitness
+
+# Levy steps for all n nests in one (n, dim) draw
+def levy_flights(n, dim=num_items, Lambda=1.5, rng=np.random):
+    u = rng.normal(0, levy_sigma(Lambda), size=(n, dim))
+    v = rng.normal(0, 1, size=(n, dim))
+    return u / np.abs(v) ** (1 / Lambda)
+
+# Fitness of every row at once: one matrix product gives weight and value
+def fitness_batch(solutions, weights=weights, values=values, capacity=W):
+    totals = solutions @ np.column_stack([weights, values])
+    return np.where(totals[:, 0] > capacity, 0, totals[:, 1])
+
+# Whole-nest iteration: all candidates are generated and scored together,
+# and acceptance and abandonment are applied as boolean masks
+def cuckoo_search_knapsack_vectorized(n=20, Pa=0.25, max_iter=500, weights=weights,
+                                      values=values, capacity=W, seed=None, instrumentation=None):
+    instr = instrumentation or NULL_INSTRUMENTATION
+    rng = np.random.default_rng(seed)
+    dim = len(weights)
+    nests = rng.integers(0, 2, size=(n, dim))
+    fitness_vals = fitness_batch(nests, weights, values, capacity)
+
+    best_idx = np.argmax(fitness_vals)
+    best_nest = nests[best_idx].copy()
+    best_fitness = fitness_vals[best_idx]
+
+    for t in range(max_iter):
+        instr.mark()
+        probs = sigmoid(nests + levy_flights(n, dim, rng=rng))
+        candidates = (rng.random((n, dim)) < probs).astype(nests.dtype)
+        instr.lap("update")
+        new_fitness = fitness_batch(candidates, weights, values, capacity)
+        instr.lap("evaluate")
+
+        accept = new_fitness > fitness_vals
+        nests[accept] = candidates[accept]
+        fitness_vals[accept] = new_fitness[accept]
+        best_idx = np.argmax(fitness_vals)
+        if fitness_vals[best_idx] > best_fitness:
+            best_fitness = fitness_vals[best_idx]
+            best_nest = nests[best_idx].copy()
+
+        abandon = rng.random(n) < Pa
+        nests[abandon] = rng.integers(0, 2, size=(abandon.sum(), dim))
+        fitness_vals[abandon] = fitness_batch(nests[abandon], weights, values, capacity)
+        best_idx = np.argmax(fitness_vals)
+        if fitness_vals[best_idx] > best_fitness:
+            best_fitness = fitness_vals[best_idx]
+            best_nest = nests[best_idx].copy()
+        instr.count_evaluations(n + abandon.sum())
+        instr.lap("update")
+        instr.end_iteration(best_fitness)
+
+    return best_nest, best_fitness
+
+# Ask/tell form of the vectorized search. The first batch is the initial
+# nests; after that each batch is the replacements for last iteration's
+# abandoned nests followed by one Levy candidate per nest, so abandonment
+# and the Levy move share one evaluation call.
+class CuckooSearchOptimizer(Optimizer):
+    maximize = True
+
+    def __init__(self, n=20, Pa=0.25, weights=weights, values=values, capacity=W,
+                 objective=None, Lambda=1.5, seed=None):
+        if objective is None:
+            objective = partial(fitness_batch, weights=weights, values=values, capacity=capacity)
+        super().__init__(objective)
+        self.Pa = Pa
+        self.Lambda = Lambda
+        self.rng = np.random.default_rng(seed)
+        self.nests = self.rng.integers(0, 2, size=(n, len(weights)))
+        self.fitness_vals = None
+        self.pending = np.empty(0, dtype=np.intp)    # abandoned nests awaiting a score
+
+    def ask(self):
+        if self.fitness_vals is None:
+            return self.nests.copy()
+        n, dim = self.nests.shape
+        probs = sigmoid(self.nests + levy_flights(n, dim, self.Lambda, self.rng))
+        candidates = (self.rng.random((n, dim)) < probs).astype(self.nests.dtype)
+        return np.vstack((self.nests[self.pending], candidates))
+
+    def tell(self, candidates, fitness):
+        fitness = np.asarray(fitness)
+        if self.fitness_vals is None:
+            self.fitness_vals = fitness.copy()
+        else:
+            k = len(self.pending)
+            self.fitness_vals[self.pending] = fitness[:k]
+            candidates, fitness = candidates[k:], fitness[k:]
+            accept = fitness > self.fitness_vals
+            self.nests[accept] = candidates[accept]
+            self.fitness_vals[accept] = fitness[accept]
+        self.record_best(self.nests, self.fitness_vals)
+
+        abandon = self.rng.random(len(self.nests)) < self.Pa
+        self.pending = np.flatnonzero(abandon)
+        self.nests[abandon] = self.rng.integers(0, 2, size=(len(self.pending), self.nests.shape[1]))
+
+# ---------------------------------------------------------------
+# Packed-bit nests with incremental (delta) fitness
+# ---------------------------------------------------------------
+# Nests are rows of a uint8 bit matrix (np.packbits layout, 8 items per
+# byte) with running weight and value totals per nest, so a 100k-item nest
+# costs 12.5 kB instead of 800 kB.
+class PackedNests:
+    def __init__(self, bits, items, weights, values):
+        self.bits = bits
+        self.items = items
+        self.weights = np.asarray(weights, dtype=np.int64)
+        self.values = np.asarray(values, dtype=np.int64)
+        unpacked = np.unpackbits(bits, axis=1, count=items)
+        self.total_weight = unpacked @ self.weights
+        self.total_value = unpacked @ self.values
+
+    @classmethod
+    def random(cls, n, weights, values, density=0.5, rng=None):
+        rng = np.random.default_rng(rng)
+        return cls(np.packbits(rng.random((n, len(weights))) < density, axis=1), len(weights), weights, values)
+
+    def __len__(self):
+        return len(self.bits)
+
+    def get(self, rows, cols):
+        return (self.bits[rows, cols >> 3] >> (7 - (cols & 7))) & 1
+
+    # Weight and value change per nest if bits (rows, cols) were flipped;
+    # (row, col) pairs must be unique
+    def delta(self, rows, cols):
+        sign = 1 - 2 * self.get(rows, cols).astype(np.int64)
+        dw = np.zeros(len(self), dtype=np.int64)
+        dv = np.zeros(len(self), dtype=np.int64)
+        np.add.at(dw, rows, sign * self.weights[cols])
+        np.add.at(dv, rows, sign * self.values[cols])
+        return dw, dv
+
+    def flip(self, rows, cols):
+        np.bitwise_xor.at(self.bits, (rows, cols >> 3), (0x80 >> (cols & 7)).astype(np.uint8))
+
+    def unpack(self, row):
+        return np.unpackbits(self.bits[row], count=self.items)
+
+    # Flip set that greedily re-packs the proposed items (rows, cols) (unique
+    # pairs) of each nest: they are taken in value-density order while they
+    # fit in the capacity left by the rest of the nest, and the items whose
+    # membership changes are returned. O(k log k) for k proposed items.
+    def repack_flips(self, rows, cols, capacity):
+        held = self.get(rows, cols) == 1
+        w = self.weights[cols]
+        held_weight = np.zeros(len(self), dtype=np.int64)
+        np.add.at(held_weight, rows[held], w[held])
+        room = capacity - (self.total_weight - held_weight)
+
+        order = np.lexsort((-self.values[cols] / np.maximum(w, 1), rows))
+        r, w = rows[order], w[order]
+        used = np.cumsum(w)
+        first = np.r_[True, r[1:] != r[:-1]] if len(r) else np.zeros(0, dtype=bool)
+        used -= (used - w)[first][np.cumsum(first) - 1]          # running weight within each nest
+        take = np.empty(len(order), dtype=bool)
+        take[order] = used <= room[r]
+        flips = take != held
+        return rows[flips], cols[flips]
+
+# Selection score: feasible nests rank by value, infeasible ones below every
+# feasible nest by how far they are over capacity, so moves that shed excess
+# weight are accepted
+def knapsack_score(total_weight, total_value, capacity):
+    return np.where(total_weight > capacity, capacity - total_weight, total_value)
+
+# k distinct random items for each row in `counts`, as flat (rows, cols)
+def _random_bits(counts, items, rng):
+    rows = np.repeat(np.arange(len(counts)), counts)
+    keys = np.unique(rows * items + rng.integers(0, items, len(rows)))   # a repeated item would flip back
+    return np.divmod(keys, items)
+
+# Cuckoo search on PackedNests. Resampling every bit through the sigmoid, as
+# the other variants do, changes about half the items per move, so here the
+# Levy step sets how many random items a move tries instead:
+# 1 + floor(step_scale * |step|), heavy-tailed. The tried items are
+# re-packed greedily (PackedNests.repack_flips) and the move is priced from
+# the flipped items alone, so an iteration costs O(flips), not O(items).
+# Nests are ranked by knapsack_score, so overweight nests keep moving
+# towards feasibility. Abandoned nests re-pack `abandon_flips` random items
+# instead of being redrawn. Initial nests are drawn with `density`
+# (default: capacity / total weight, capped at 0.5).
+def cuckoo_search_knapsack_packed(n=20, Pa=0.25, max_iter=500, weights=weights, values=values, capacity=W,
+                                  Lambda=1.5, density=None, step_scale=None, abandon_flips=None, seed=None,
+                                  instrumentation=None):
+    instr = instrumentation or NULL_INSTRUMENTATION
+    rng = np.random.default_rng(seed)
+    items = len(weights)
+    if density is None:
+        density = min(0.5, capacity / max(1, int(np.sum(weights))))
+    if step_scale is None:
+        step_scale = max(1.0, items / 1000)
+    if abandon_flips is None:
+        abandon_flips = max(1, items // 100)
+    nests = PackedNests.random(n, weights, values, density, rng)
+    scores = knapsack_score(nests.total_weight, nests.total_value, capacity)
+
+    best_bits, best_fitness = None, 0
+    for t in range(max_iter + 1):
+        if t > 0:
+            instr.mark()
+            flips = 1 + np.floor(step_scale * np.abs(levy_flights(n, 1, Lambda, rng)[:, 0]))
+            tried = _random_bits(np.minimum(flips, items).astype(np.int64), items, rng)
+            rows, cols = nests.repack_flips(*tried, capacity)
+            instr.lap("update")
+
+            dw, dv = nests.delta(rows, cols)
+            new_weight = nests.total_weight + dw
+            new_value = nests.total_value + dv
+            new_scores = knapsack_score(new_weight, new_value, capacity)
+            instr.lap("evaluate")
+
+            accept = new_scores > scores
+            moved = accept[rows]
+            nests.flip(rows[moved], cols[moved])
+            nests.total_weight[accept] = new_weight[accept]
+            nests.total_value[accept] = new_value[accept]
+            scores[accept] = new_scores[accept]
+
+            abandon = rng.random(n) < Pa
+            counts = np.where(abandon, min(abandon_flips, items), 0)
+            rows, cols = nests.repack_flips(*_random_bits(counts, items, rng), capacity)
+            dw, dv = nests.delta(rows, cols)
+            nests.flip(rows, cols)
+            nests.total_weight += dw
+            nests.total_value += dv
+            scores[abandon] = knapsack_score(nests.total_weight, nests.total_value, capacity)[abandon]
+
+        feasible = nests.total_weight <= capacity
+        if feasible.any():
+            i = int(np.flatnonzero(feasible)[np.argmax(scores[feasible])])
+            if best_bits is None or scores[i] > best_fitness:
+                best_fitness = scores[i]
+                best_bits = nests.bits[i].copy()
+        if t > 0:
+            instr.count_evaluations(n + int(abandon.sum()))
+            instr.lap("update")
+            instr.end_iteration(best_fitness)
+
+    if best_bits is None:
+        return np.zeros(items, dtype=np.uint8), 0
+    return np.unpackbits(best_bits, count=items), best_fitness
+
+# ---------------------------------------------------------------
+# Batched solver for many independent instances
+# ---------------------------------------------------------------
+# Stacked instances: weights and values are (instances, items), capacities
+# is (instances,). Instances with fewer items are padded with zero-weight,
+# zero-value items; give their real sizes as `item_counts`, or padding is
+# recognised as exactly such items. Padding columns are zeroed on every
+# draw, so they are never packed. All nests of all instances form one (instances, nests,
+# items) tensor; Levy steps, fitness and acceptance are single array
+# operations per iteration. The instrumentation best is the total of the
+# per-instance best values.
+def fitness_instances(nests, weights, values, capacities):
+    totals = nests @ np.stack((weights, values), axis=2)        # (instances, nests, 2)
+    return np.where(totals[..., 0] > capacities[:, None], 0, totals[..., 1])
+
+def cuckoo_search_knapsack_batch(weights, values, capacities, n=20, Pa=0.25, max_iter=500, Lambda=1.5,
+                                 item_counts=None, seed=None, instrumentation=None):
+    instr = instrumentation or NULL_INSTRUMENTATION
+    rng = np.random.default_rng(seed)
+    weights = np.asarray(weights, dtype=np.int64)
+    values = np.asarray(values, dtype=np.int64)
+    capacities = np.asarray(capacities, dtype=np.int64)
+    instances, items = weights.shape
+    rows = np.arange(instances)
+    if item_counts is None:
+        real = (weights != 0) | (values != 0)
+    else:
+        real = np.arange(items) < np.asarray(item_counts)[:, None]
+    real = real.astype(np.int8)                                 # (instances, items)
+
+    nests = rng.integers(0, 2, size=(instances, n, items), dtype=np.int8) * real[:, None]
+    fitness_vals = fitness_instances(nests, weights, values, capacities)
+    best_idx = np.argmax(fitness_vals, axis=1)
+    best_nests = nests[rows, best_idx].copy()
+    best_values = fitness_vals[rows, best_idx]
+
+    for t in range(max_iter):
+        instr.mark()
+        steps = levy_flights(instances * n, items, Lambda, rng).reshape(nests.shape)
+        candidates = (rng.random(nests.shape) < sigmoid(nests + steps)).astype(np.int8) * real[:, None]
+        instr.lap("update")
+        new_fitness = fitness_instances(candidates, weights, values, capacities)
+        instr.lap("evaluate")
+
+        accept = new_fitness > fitness_vals
+        nests[accept] = candidates[accept]
+        fitness_vals[accept] = new_fitness[accept]
+
+        abandon = rng.random((instances, n)) < Pa
+        owner = np.nonzero(abandon)[0]                            # instance of each fresh nest
+        fresh = rng.integers(0, 2, size=(abandon.sum(), items), dtype=np.int8) * real[owner]
+        nests[abandon] = fresh
+        fitness_vals[abandon] = np.where(np.einsum("ki,ki->k", fresh, weights[owner]) > capacities[owner], 0,
+                                         np.einsum("ki,ki->k", fresh, values[owner]))
+
+        best_idx = np.argmax(fitness_vals, axis=1)
+        current = fitness_vals[rows, best_idx]
+        improved = current > best_values
+        best_values[improved] = current[improved]
+        best_nests[improved] = nests[rows[improved], best_idx[improved]]
+        instr.count_evaluations(instances * n + abandon.sum())
+        instr.lap("update")
+        instr.end_iteration(best_values.sum())
+
+    return best_nests, best_values
@@ -0,0 +1,140 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+
+# ---------------------------------------------------------------
+# Pluggable fitness evaluators
+# ---------------------------------------------------------------
+# An evaluator wraps a per-candidate fitness function and is itself a
+# batched objective: evaluator(candidates) returns one fitness per candidate,
+# in candidate order. It can therefore be passed anywhere the optimizers take
+# a batched objective, e.g. GeneExpressionOptimizer(objective=evaluator).
+#
+#   with ProcessEvaluator(simulate, workers=8) as evaluate:
+#       fitness = evaluate(population)
+#
+# The pool is created on first use and reused for every later batch. The
+# process backend needs a picklable (module-level) function, which is sent
+# to each worker once rather than with every chunk.
+#
+# The serial backend accepts and ignores the pool options, so a backend can
+# be switched with make_evaluator(func, backend, workers=...) alone.
+class SerialEvaluator:
+    def __init__(self, func, workers=None, chunksize=None, target_chunk_time=None):
+        self.func = func
+
+    def __call__(self, candidates):
+        return np.array([self.func(c) for c in candidates])
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Function installed in each worker process by the pool initializer
+_worker_func = None
+
+def _install_func(func):
+    global _worker_func
+    _worker_func = func
+
+# Evaluate one chunk; also returns its run time for chunk-size tuning
+def _evaluate_chunk(func, chunk):
+    func = func or _worker_func
+    start = time.perf_counter()
+    results = [func(c) for c in chunk]
+    return results, time.perf_counter() - start
+
+
+# Candidates are split into contiguous chunks that are submitted together and
+# collected in submission order. Unless `chunksize` is fixed, the chunk size
+# adapts to the measured cost per candidate: cheap candidates are grouped so
+# each chunk runs for about `target_chunk_time` seconds (amortizing task
+# overhead), but never more than one chunk's worth per worker, so all
+# workers stay busy. The first batch uses four chunks per worker.
+class PoolEvaluator(SerialEvaluator):
+    executor_class = None
+
+    def __init__(self, func, workers=None, chunksize=None, target_chunk_time=0.05):
+        super().__init__(func)
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.target_chunk_time = target_chunk_time
+        self.item_time = None       # smoothed seconds per candidate
+        self._executor = None
+
+    def _make_executor(self):
+        return self.executor_class(self.workers)
+
+    def _submit(self, chunk):
+        return self._executor.submit(_evaluate_chunk, self.func, chunk)
+
+    def chunk_size(self, n):
+        if self.chunksize:
+            return self.chunksize
+        per_worker = -(-n // self.workers)
+        if self.item_time is None:
+            return max(1, -(-n // (4 * self.workers)))
+        by_time = int(self.target_chunk_time / max(self.item_time, 1e-9))
+        return min(max(1, by_time), per_worker)
+
+    def __call__(self, candidates):
+        if not isinstance(candidates, (np.ndarray, list, tuple)):
+            candidates = list(candidates)
+        n = len(candidates)
+        if n == 0:
+            return np.array([])
+        if self._executor is None:
+            self._executor = self._make_executor()
+
+        size = self.chunk_size(n)
+        futures = [self._submit(candidates[i:i + size]) for i in range(0, n, size)]
+        results, busy = [], 0.0
+        for future in futures:
+            chunk_results, elapsed = future.result()
+            results.extend(chunk_results)
+            busy += elapsed
+
+        item_time = busy / n
+        self.item_time = item_time if self.item_time is None else 0.5 * (self.item_time + item_time)
+        return np.array(results)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+# Threads suit functions that release the GIL: NumPy-heavy code, I/O and
+# calls to external solvers
+class ThreadEvaluator(PoolEvaluator):
+    executor_class = ThreadPoolExecutor
+
+
+# Processes suit pure-Python objectives
+class ProcessEvaluator(PoolEvaluator):
+    executor_class = ProcessPoolExecutor
+
+    def _make_executor(self):
+        return ProcessPoolExecutor(self.workers, initializer=_install_func, initargs=(self.func,))
+
+    def _submit(self, chunk):
+        return self._executor.submit(_evaluate_chunk, None, chunk)
+
+
+EVALUATORS = {
+    "serial": SerialEvaluator,
+    "thread": ThreadEvaluator,
+    "process": ProcessEvaluator,
+}
+
+def make_evaluator(func, backend="serial", **options):
+    if backend not in EVALUATORS:
+        raise ValueError(f"Unknown evaluator backend: {backend}")
+    return EVALUATORS[backend](func, **options)
@@ -0,0 +1,370 @@
+import random
+import math
+import multiprocessing
+import numpy as np
+from .base import Optimizer
+from .instrumentation import NULL_INSTRUMENTATION
+from .steady_state import run_steady_state
+
+# Example: f(x) = x * sin(10*pi*x) + 2
+def fitness_function(x):
+    return x * math.sin(10 * math.pi * x) + 2
+
+POPULATION_SIZE = 6
+GENE_LENGTH = 10
+MUTATION_RATE = 0.05
+CROSSOVER_RATE = 0.8
+GENERATIONS = 20
+DOMAIN = (-1, 2)
+
+def random_gene():
+    return random.uniform(DOMAIN[0], DOMAIN[1])
+
+def create_chromosome():
+    return [random_gene() for _ in range(GENE_LENGTH)]
+
+def initialize_population(size):
+    return [create_chromosome() for _ in range(size)]
+
+def chromosome_fitness(chromosome):
+    return fitness_function(express_gene(chromosome))
+
+# An evaluator from bis_lab.evaluators spreads the population over a pool
+def evaluate_population(population, evaluator=None):
+    if evaluator is not None:
+        return evaluator(population).tolist()
+    return [chromosome_fitness(chrom) for chrom in population]
+
+def express_gene(chromosome):
+    return sum(chromosome) / len(chromosome)
+
+def select(population, fitnesses):
+    total_fitness = sum(fitnesses)
+    pick = random.uniform(0, total_fitness)
+    current = 0
+    for individual, fitness in zip(population, fitnesses):
+        current += fitness
+        if current > pick:
+            return individual
+    return random.choice(population)
+
+# Roulette selection engine: the sampling table is built once per generation
+# and all parents are then drawn in one batched call, in O(log N) per draw
+# (cumulative sums + binary search) or O(1) per draw (Vose alias table).
+class RouletteSelector:
+    def __init__(self, fitnesses, method="cumsum", rng=None):
+        self.rng = np.random.default_rng(rng)
+        self.method = method
+
+        weights = np.asarray(fitnesses, dtype=float)
+        # Negative fitness: shift so the worst individual gets weight 0
+        if weights.min() < 0:
+            weights = weights - weights.min()
+        total = weights.sum()
+        # All weights zero: every individual is equally likely
+        if total <= 0:
+            weights = np.ones_like(weights)
+            total = weights.sum()
+        self.p = weights / total
+
+        if method == "cumsum":
+            self.cumulative = np.cumsum(self.p)
+        elif method == "alias":
+            self._build_alias_table()
+        else:
+            raise ValueError(f"Unknown selection method: {method}")
+
+    def _build_alias_table(self):
+        n = len(self.p)
+        prob = self.p * n
+        alias = np.arange(n)
+        small = list(np.flatnonzero(prob < 1))
+        large = list(np.flatnonzero(prob >= 1))
+        while small and large:
+            s, l = small.pop(), large.pop()
+            alias[s] = l
+            prob[l] -= 1 - prob[s]
+            (small if prob[l] < 1 else large).append(l)
+        prob[small + large] = 1     # leftovers are 1 up to rounding
+        self.prob, self.alias = prob, alias
+
+    # Indices of k individuals drawn with probability proportional to fitness
+    def sample(self, k):
+        if self.method == "cumsum":
+            picks = np.searchsorted(self.cumulative, self.rng.random(k) * self.cumulative[-1], side="right")
+            return np.minimum(picks, len(self.p) - 1)
+        slots = self.rng.integers(0, len(self.p), k)
+        return np.where(self.rng.random(k) < self.prob[slots], slots, self.alias[slots])
+
+def crossover(parent1, parent2):
+    if random.random() < CROSSOVER_RATE:
+        point = random.randint(1, GENE_LENGTH - 1)
+        child1 = parent1[:point] + parent2[point:]
+        child2 = parent2[:point] + parent1[point:]
+        return child1, child2
+    return parent1[:], parent2[:]
+
+def mutate(chromosome):
+    new_chromosome = []
+    for gene in chromosome:
+        if random.random() < MUTATION_RATE:
+            new_chromosome.append(random_gene())
+        else:
+            new_chromosome.append(gene)
+    return new_chromosome
+
+def gene_expression_algorithm(instrumentation=None, evaluator=None):
+    instr = instrumentation or NULL_INSTRUMENTATION
+    population = initialize_population(POPULATION_SIZE)
+    best_solution = None
+    best_fitness = float("-inf")
+
+    for generation in range(GENERATIONS):
+        instr.mark()
+        fitnesses = evaluate_population(population, evaluator)
+        instr.count_evaluations(len(population))
+
+        for i, chrom in enumerate(population):
+            if fitnesses[i] > best_fitness:
+                best_fitness = fitnesses[i]
+                best_solution = chrom[:]
+        instr.lap("evaluate")
+
+        new_population = []
+        # Seeded from `random` so that random.seed() reproduces the whole run
+        selector = RouletteSelector(fitnesses, rng=random.getrandbits(64))
+        parents = selector.sample(POPULATION_SIZE + POPULATION_SIZE % 2)
+        for k in range(0, len(parents), 2):
+            parent1 = population[parents[k]]
+            parent2 = population[parents[k + 1]]
+            offspring1, offspring2 = crossover(parent1, parent2)
+            offspring1 = mutate(offspring1)
+            offspring2 = mutate(offspring2)
+            new_population.extend([offspring1, offspring2])
+
+        population = new_population[:POPULATION_SIZE]
+        instr.lap("update")
+        instr.end_iteration(best_fitness, solution=best_solution)
+
+    return best_solution, best_fitness
+
+# Steady-state GEA: one child per completed evaluation, from two roulette
+# parents drawn on the fitness already known
+def breed_one(population, fitnesses):
+    i, j = RouletteSelector(fitnesses, rng=random.getrandbits(64)).sample(2)
+    return mutate(crossover(population[i], population[j])[0])
+
+def gene_expression_algorithm_steady_state(evaluations=POPULATION_SIZE * GENERATIONS, in_flight=4,
+                                           replacement="worst", evaluate=chromosome_fitness,
+                                           executor=None, instrumentation=None):
+    return run_steady_state(initialize_population(POPULATION_SIZE), breed_one, evaluate, evaluations,
+                            in_flight, replacement, executor=executor, instrumentation=instrumentation)
+
+# ---------------------------------------------------------------
+# Array-backed mode: the population is one (size, GENE_LENGTH) ndarray
+# ---------------------------------------------------------------
+def fitness_function_array(x):
+    return x * np.sin(10 * np.pi * x) + 2
+
+def initialize_population_array(size, gene_length=GENE_LENGTH, rng=None, dtype=np.float64):
+    rng = np.random.default_rng(rng)
+    return rng.uniform(DOMAIN[0], DOMAIN[1], size=(size, gene_length)).astype(dtype, copy=False)
+
+def express_genes(population):
+    return population.mean(axis=1)
+
+def evaluate_population_array(population):
+    return fitness_function_array(express_genes(population))
+
+# Single-point crossover of consecutive rows: tails are swapped in place
+def crossover_array(population, rng, rate=CROSSOVER_RATE):
+    pairs = len(population) // 2
+    gene_length = population.shape[1]
+    first, second = population[0:2 * pairs:2], population[1:2 * pairs:2]
+    point = rng.integers(1, gene_length, pairs)
+    point[rng.random(pairs) >= rate] = gene_length      # no crossover for this pair
+    tail = np.arange(gene_length) >= point[:, None]
+    swapped = first[tail]
+    first[tail] = second[tail]
+    second[tail] = swapped
+    return population
+
+# Mutation in place: positions of a Bernoulli(rate) process over all genes
+# are drawn from geometric gaps, so no full-size random matrix is needed
+def mutate_array(population, rng, rate=MUTATION_RATE):
+    if rate <= 0:
+        return population
+    flat = population.reshape(-1)
+    batch = int(flat.size * rate + 6 * math.sqrt(flat.size * rate)) + 16
+    positions = np.cumsum(rng.geometric(rate, size=batch)) - 1
+    while positions[-1] < flat.size:
+        positions = np.concatenate([positions, positions[-1] + np.cumsum(rng.geometric(rate, size=batch))])
+    positions = positions[positions < flat.size]
+    flat[positions] = rng.uniform(DOMAIN[0], DOMAIN[1], size=len(positions))
+    return population
+
+def gene_expression_algorithm_array(population_size=POPULATION_SIZE, gene_length=GENE_LENGTH,
+                                    generations=GENERATIONS, evaluate=evaluate_population_array,
+                                    seed=None, dtype=np.float64, instrumentation=None):
+    instr = instrumentation or NULL_INSTRUMENTATION
+    rng = np.random.default_rng(seed)
+    population = initialize_population_array(population_size, gene_length, rng, dtype)
+    best_solution = None
+    best_fitness = float("-inf")
+
+    for generation in range(generations):
+        instr.mark()
+        fitnesses = evaluate(population)
+        instr.count_evaluations(len(population))
+        instr.lap("evaluate")
+        i = int(np.argmax(fitnesses))
+        if fitnesses[i] > best_fitness:
+            best_fitness = float(fitnesses[i])
+            best_solution = population[i].copy()
+
+        parents = RouletteSelector(fitnesses, rng=rng).sample(population_size)
+        population = mutate_array(crossover_array(population[parents], rng), rng)
+        instr.lap("update")
+        instr.end_iteration(best_fitness)
+
+    return best_solution, best_fitness
+
+# Ask/tell form of the array GEA
+class GeneExpressionOptimizer(Optimizer):
+    maximize = True
+
+    def __init__(self, population_size=POPULATION_SIZE, gene_length=GENE_LENGTH,
+                 objective=evaluate_population_array, crossover_rate=CROSSOVER_RATE,
+                 mutation_rate=MUTATION_RATE, selection="cumsum", seed=None, dtype=np.float64):
+        super().__init__(objective)
+        self.population_size = population_size
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = mutation_rate
+        self.selection = selection
+        self.rng = np.random.default_rng(seed)
+        self.population = initialize_population_array(population_size, gene_length, self.rng, dtype)
+
+    def ask(self):
+        return self.population
+
+    def tell(self, candidates, fitness):
+        fitness = np.asarray(fitness)
+        self.record_best(candidates, fitness)
+        parents = RouletteSelector(fitness, self.selection, self.rng).sample(self.population_size)
+        children = crossover_array(candidates[parents], self.rng, self.crossover_rate)
+        self.population = mutate_array(children, self.rng, self.mutation_rate)
+
+# ---------------------------------------------------------------
+# Island model: one population per process with periodic migration
+# ---------------------------------------------------------------
+TOPOLOGIES = ("ring", "full", "random")
+
+# (source, destination) island pairs for one migration round
+def migration_routes(islands, topology="ring", rng=None):
+    if islands < 2:
+        return []
+    if topology == "ring":
+        return [(i, (i + 1) % islands) for i in range(islands)]
+    if topology == "full":
+        return [(i, j) for i in range(islands) for j in range(islands) if i != j]
+    if topology == "random":
+        rng = np.random.default_rng(rng)
+        return [(i, int((i + rng.integers(1, islands)) % islands)) for i in range(islands)]
+    raise ValueError(f"Unknown migration topology: {topology}")
+
+# Island process: evolves its own GeneExpressionOptimizer. Each request is
+# (generations, immigrants); immigrants replace random members of the next
+# generation, and the reply is (elites, best_solution, best_fitness) with
+# the `migrants` fittest chromosomes of the last evaluated generation.
+def _island_worker(conn, options, migrants, seed):
+    optimizer = GeneExpressionOptimizer(seed=seed, **options)
+    rng = optimizer.rng
+    while True:
+        request = conn.recv()
+        if request is None:
+            break
+        generations, immigrants = request
+        if len(immigrants):
+            slots = rng.choice(len(optimizer.population), min(len(immigrants), len(optimizer.population)),
+                               replace=False)
+            optimizer.population[slots] = immigrants[:len(slots)]
+        for _ in range(generations):
+            candidates = optimizer.ask()
+            fitness = optimizer.evaluate(candidates)
+            elites = candidates[np.argsort(fitness)[-migrants:]].copy() if migrants else candidates[:0].copy()
+            optimizer.tell(candidates, fitness)
+        conn.send((elites, optimizer.best_solution, optimizer.best_fitness))
+    conn.close()
+
+# Islands evolve in parallel for `migration_interval` generations at a time;
+# between rounds only the elites travel, batched per destination, along the
+# chosen topology. Every island gets its own SeedSequence child of `seed`.
+# Migrants per destination are capped at half its population.
+def gene_expression_algorithm_islands(islands=4, population_size=POPULATION_SIZE, gene_length=GENE_LENGTH,
+                                      generations=GENERATIONS, migration_interval=5, migrants=1,
+                                      topology="ring", evaluate=evaluate_population_array, seed=None,
+                                      instrumentation=None):
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown migration topology: {topology}")
+    if islands < 1:
+        raise ValueError(f"Need at least one island, got {islands}")
+    if migration_interval < 1:
+        raise ValueError(f"migration_interval must be at least 1, got {migration_interval}")
+    if migrants < 0:
+        raise ValueError(f"migrants must not be negative, got {migrants}")
+    instr = instrumentation or NULL_INSTRUMENTATION
+    root = np.random.SeedSequence(seed)
+    island_seeds = root.spawn(islands)
+    rng = np.random.default_rng(root.spawn(1)[0])
+    options = {"population_size": population_size, "gene_length": gene_length, "objective": evaluate}
+    capacity = max(1, population_size // 2)
+
+    connections, processes = [], []
+    try:
+        for i in range(islands):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_island_worker, args=(child, options, migrants, island_seeds[i]),
+                                              daemon=True)
+            process.start()
+            child.close()
+            connections.append(parent)
+            processes.append(process)
+
+        best_solution, best_fitness = None, float("-inf")
+        immigrants = [np.empty((0, gene_length))] * islands
+        done = 0
+        while done < generations:
+            instr.mark()
+            rounds = min(migration_interval, generations - done)
+            for conn, incoming in zip(connections, immigrants):
+                conn.send((rounds, incoming))
+            results = [conn.recv() for conn in connections]
+            done += rounds
+            instr.count_evaluations(islands * population_size * rounds)
+            instr.lap("evolve")
+
+            for elites, solution, fitness in results:
+                if solution is not None and fitness > best_fitness:
+                    best_solution, best_fitness = solution, float(fitness)
+
+            incoming = [[] for _ in range(islands)]
+            for source, destination in migration_routes(islands, topology, rng):
+                incoming[destination].append(results[source][0])
+            immigrants = []
+            for batch in incoming:
+                batch = np.concatenate(batch) if batch else np.empty((0, gene_length))
+                if len(batch) > capacity:
+                    batch = batch[rng.choice(len(batch), capacity, replace=False)]
+                immigrants.append(batch)
+            instr.lap("migrate")
+            instr.end_iteration(best_fitness)
+        return best_solution, best_fitness
+    finally:
+        for conn in connections:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+            conn.close()
+        for process in processes:
+            process.join()
@@ -0,0 +1,284 @@
+import random
+from collections import OrderedDict
+import numpy as np
+from .base import Optimizer
+from .instrumentation import NULL_INSTRUMENTATION
+from .steady_state import run_steady_state
+
+# Parameters
+POP_SIZE = 6
+GENES = 5        # 5 bits to represent 0-31
+GENERATIONS = 5
+CROSSOVER_RATE = 0.7
+MUTATION_RATE = 0.1
+FITNESS_CACHE_SIZE = 4096  # max genomes kept in the fitness cache
+
+# Fitness function: f(x) = x^2
+def fitness(binary_str):
+    x = int(binary_str, 2)
+    return x * x
+
+# Fitness cache: bounded LRU memo in front of the fitness function
+class FitnessCache:
+    def __init__(self, func, maxsize=FITNESS_CACHE_SIZE):
+        self.func = func
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __call__(self, genome):
+        if genome in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(genome)
+            return self.entries[genome]
+
+        self.misses += 1
+        value = self.func(genome)
+        self.entries[genome] = value
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)     # drop least recently used
+            self.evictions += 1
+        return value
+
+    def hit_rate(self):
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size": len(self.entries), "hit_rate": self.hit_rate()}
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+# Create initial population of random 5-bit binary strings
+def create_population():
+    population = []
+    for _ in range(POP_SIZE):
+        individual = ''.join(random.choice('01') for _ in range(GENES))
+        population.append(individual)
+    return population
+
+# Selection: Tournament Selection of size 2
+def tournament_selection(pop, evaluate=fitness):
+    i1, i2 = random.sample(pop, 2)
+    return i1 if evaluate(i1) > evaluate(i2) else i2
+
+# Crossover: Single-point crossover
+def crossover(parent1, parent2):
+    if random.random() < CROSSOVER_RATE:
+        point = random.randint(1, GENES - 1)
+        child1 = parent1[:point] + parent2[point:]
+        child2 = parent2[:point] + parent1[point:]
+        return child1, child2
+    else:
+        return parent1, parent2
+
+# Mutation: Bit flip mutation
+def mutate(individual):
+    new_ind = ''
+    for bit in individual:
+        if random.random() < MUTATION_RATE:
+            new_ind += '1' if bit == '0' else '0'
+        else:
+            new_ind += bit
+    return new_ind
+
+# Main GA function. Fitness goes through `cache` (a new FitnessCache per
+# run if None); pass one in to read its stats afterwards.
+def genetic_algorithm(instrumentation=None, cache=None):
+    instr = instrumentation or NULL_INSTRUMENTATION
+    cached_fitness = cache if cache is not None else FitnessCache(fitness)
+    population = create_population()
+    best_individual = None
+    best_fitness = -1
+
+    for gen in range(1, GENERATIONS + 1):
+        instr.mark()
+        new_population = []
+
+        # Evaluate and keep track of best
+        for ind in population:
+            ind_fit = cached_fitness(ind)
+            if ind_fit > best_fitness:
+                best_fitness = ind_fit
+                best_individual = ind
+        instr.count_evaluations(len(population))
+        instr.lap("evaluate")
+
+        # Create new generation
+        while len(new_population) < POP_SIZE:
+            parent1 = tournament_selection(population, cached_fitness)
+            parent2 = tournament_selection(population, cached_fitness)
+            child1, child2 = crossover(parent1, parent2)
+            child1 = mutate(child1)
+            child2 = mutate(child2)
+            new_population.extend([child1, child2])
+
+        population = new_population[:POP_SIZE]
+        instr.lap("update")
+        instr.end_iteration(best_fitness, individual=best_individual)
+
+    return best_individual, best_fitness
+
+# Steady-state GA: one child per completed evaluation, bred by tournament
+# selection on the fitness already known, crossover and mutation
+def breed_one(population, fitnesses):
+    parents = []
+    for _ in range(2):
+        i1, i2 = random.sample(range(len(population)), 2)
+        parents.append(population[i1] if fitnesses[i1] > fitnesses[i2] else population[i2])
+    return mutate(crossover(*parents)[0])
+
+def genetic_algorithm_steady_state(evaluations=POP_SIZE * GENERATIONS, in_flight=4, replacement="worst",
+                                   evaluate=fitness, executor=None, instrumentation=None):
+    return run_steady_state(create_population(), breed_one, evaluate, evaluations, in_flight,
+                            replacement, executor=executor, instrumentation=instrumentation)
+
+# ---------------------------------------------------------------
+# Bit-packed population backend
+# ---------------------------------------------------------------
+# Individuals are rows of one uint8 matrix, 8 genes per byte, most
+# significant bit first (same order as the '01' strings). Selection,
+# crossover and mutation run over the whole population at once.
+class PackedPopulation:
+    def __init__(self, bits, genes=GENES):
+        self.bits = bits        # shape (pop_size, ceil(genes / 8)), dtype uint8
+        self.genes = genes
+
+    @classmethod
+    def random(cls, pop_size=POP_SIZE, genes=GENES, rng=None):
+        rng = np.random.default_rng(rng)
+        bits = rng.integers(0, 256, size=(pop_size, (genes + 7) // 8), dtype=np.uint8)
+        bits[:, -1] &= np.uint8((0xFF << (-genes % 8)) & 0xFF)   # keep pad bits zero
+        return cls(bits, genes)
+
+    @classmethod
+    def from_strings(cls, individuals):
+        genes = len(individuals[0])
+        raw = np.frombuffer(''.join(individuals).encode(), dtype=np.uint8) - ord('0')
+        return cls(np.packbits(raw.reshape(len(individuals), genes), axis=1), genes)
+
+    # String view: population[i] is the usual '01' string
+    def __len__(self):
+        return self.bits.shape[0]
+
+    def __getitem__(self, i):
+        return (np.unpackbits(self.bits[i], count=self.genes) + ord('0')).tobytes().decode()
+
+    def __iter__(self):
+        return iter(self.to_strings())
+
+    def to_strings(self):
+        chars = np.unpackbits(self.bits, axis=1, count=self.genes) + ord('0')
+        return [row.tobytes().decode() for row in chars]
+
+    # Bulk decode of every genome to its integer value
+    def decode(self):
+        nbytes = self.bits.shape[1]
+        shift = -self.genes % 8
+        if nbytes <= 8:
+            padded = np.zeros((len(self), 8), dtype=np.uint8)
+            padded[:, 8 - nbytes:] = self.bits
+            return padded.view('>u8').ravel().astype(np.uint64) >> np.uint64(shift)
+        return np.array([int.from_bytes(row.tobytes(), 'big') >> shift for row in self.bits], dtype=object)
+
+    # Selection: tournament of size 2 for n parents in one draw
+    def tournament_select(self, fitnesses, n, rng):
+        i1 = rng.integers(0, len(self), n)
+        i2 = rng.integers(0, len(self) - 1, n)
+        i2 += i2 >= i1                      # two distinct contestants, like random.sample
+        winners = np.where(fitnesses[i1] > fitnesses[i2], i1, i2)
+        return PackedPopulation(self.bits[winners], self.genes)
+
+    # Crossover: single point for consecutive pairs, applied through byte masks
+    def crossover(self, rng, rate=CROSSOVER_RATE):
+        p1, p2 = self.bits[0::2], self.bits[1::2]
+        pairs = len(p2)
+        p1 = p1[:pairs]
+        point = rng.integers(1, self.genes, pairs)
+        point[rng.random(pairs) >= rate] = self.genes       # no crossover: child = parent
+        full, rest = point // 8, point % 8
+        byte = np.arange(self.bits.shape[1])
+        partial = ((0xFF << (8 - rest)) & 0xFF).astype(np.uint8)
+        mask = np.where(byte < full[:, None], np.uint8(0xFF),
+                        np.where(byte == full[:, None], partial[:, None], np.uint8(0)))
+        children = self.bits.copy()
+        children[0:2 * pairs:2] = (p1 & mask) | (p2 & ~mask)
+        children[1:2 * pairs:2] = (p2 & mask) | (p1 & ~mask)
+        return PackedPopulation(children, self.genes)
+
+    # Mutation: bit flips XORed in at the positions of a Bernoulli(rate)
+    # process over all bits. Positions come from geometric gaps, `chunk` at
+    # a time, so memory stays bounded however large the population is.
+    def mutate(self, rng, rate=MUTATION_RATE, chunk=1 << 16):
+        bits = self.bits.copy()
+        total = len(self) * self.genes
+        last = -1
+        while rate > 0 and last < total:
+            positions = last + np.cumsum(rng.geometric(rate, size=chunk))
+            last = positions[-1]
+            rows, cols = np.divmod(positions[positions < total], self.genes)
+            np.bitwise_xor.at(bits, (rows, cols >> 3), (0x80 >> (cols & 7)).astype(np.uint8))
+        return PackedPopulation(bits, self.genes)
+
+# Fitness f(x) = x^2 for every genome at once
+def packed_fitness(population):
+    x = population.decode()
+    if population.genes > 32:
+        x = x.astype(object)        # x^2 no longer fits in 64 bits
+    return x * x
+
+# GA on the packed backend; returns the best individual as a '01' string
+def genetic_algorithm_packed(pop_size=POP_SIZE, genes=GENES, generations=GENERATIONS,
+                             evaluate=packed_fitness, seed=None, instrumentation=None):
+    instr = instrumentation or NULL_INSTRUMENTATION
+    rng = np.random.default_rng(seed)
+    population = PackedPopulation.random(pop_size, genes, rng)
+    best_individual = None
+    best_fitness = float('-inf')    # custom evaluate functions may return negative fitness
+
+    for gen in range(1, generations + 1):
+        instr.mark()
+        fitnesses = evaluate(population)
+        instr.count_evaluations(len(population))
+        instr.lap("evaluate")
+        idx = int(np.argmax(fitnesses))
+        if fitnesses[idx] > best_fitness:
+            best_fitness = fitnesses[idx]
+            best_individual = population[idx]
+
+        parents = population.tournament_select(fitnesses, pop_size + pop_size % 2, rng)
+        children = parents.crossover(rng).mutate(rng)
+        population = PackedPopulation(children.bits[:pop_size], genes)
+        instr.lap("update")
+        instr.end_iteration(best_fitness)
+
+    return best_individual, best_fitness
+
+# Ask/tell form of the packed GA: ask() hands out the current generation,
+# tell() takes its fitness and breeds the next one
+class GeneticOptimizer(Optimizer):
+    maximize = True
+
+    def __init__(self, pop_size=POP_SIZE, genes=GENES, objective=packed_fitness,
+                 crossover_rate=CROSSOVER_RATE, mutation_rate=MUTATION_RATE, seed=None):
+        super().__init__(objective)
+        self.pop_size = pop_size
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = mutation_rate
+        self.rng = np.random.default_rng(seed)
+        self.population = PackedPopulation.random(pop_size, genes, self.rng)
+
+    def ask(self):
+        return self.population
+
+    def tell(self, candidates, fitness):
+        fitness = np.asarray(fitness)
+        self.record_best(candidates, fitness)
+        parents = candidates.tournament_select(fitness, self.pop_size + self.pop_size % 2, self.rng)
+        children = parents.crossover(self.rng, self.crossover_rate).mutate(self.rng, self.mutation_rate)
+        self.population = PackedPopulation(children.bits[:self.pop_size], candidates.genes)
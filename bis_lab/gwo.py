@@ -0,0 +1,181 @@
+import os
+import numpy as np
+from .base import Optimizer
+from .checkpoint import load_checkpoint, rng_state, save_checkpoint, set_rng_state
+from .evaluators import SerialEvaluator
+from .instrumentation import ConvergenceHistory, NULL_INSTRUMENTATION
+
+class GreyWolfOptimizer(Optimizer):
+    def __init__(self, obj_func, lb, ub, dim, num_wolves=20, max_iter=100, batch_obj_func=None,
+                 instrumentation=None, seed=None, evaluator=None, checkpoint_path=None,
+                 checkpoint_every=10, resume=False):
+        super().__init__(batch_obj_func)
+        self.obj_func = obj_func      # Objective function
+        self.batch_obj_func = batch_obj_func  # Optional: scores a (num_wolves, dim) matrix at once
+        self.evaluator = evaluator or SerialEvaluator(obj_func)  # Per-wolf calls, optionally on a pool
+        self.lb = np.array(lb)        # Lower bound
+        self.ub = np.array(ub)        # Upper bound
+        self.dim = dim                # Dimension of problem
+        self.num_wolves = num_wolves
+        self.max_iter = max_iter
+        self.rng = np.random if seed is None else np.random.RandomState(seed)
+        self.t = 0                    # iterations told so far
+
+        # Initialize wolves randomly within search space
+        self.positions = self.rng.uniform(self.lb, self.ub, (self.num_wolves, self.dim))
+        
+        # Initialize alpha, beta, delta wolves
+        self.alpha_pos = np.zeros(self.dim)
+        self.alpha_score = float('inf')
+        
+        self.beta_pos = np.zeros(self.dim)
+        self.beta_score = float('inf')
+        
+        self.delta_pos = np.zeros(self.dim)
+        self.delta_score = float('inf')
+        
+        self.convergence_curve = ConvergenceHistory(max_iter)
+        self.instrumentation = instrumentation or NULL_INSTRUMENTATION
+
+        # Snapshot every `checkpoint_every` iterations. With resume=True an
+        # unfinished snapshot at the same path is resumed from; a finished
+        # one is ignored and the run starts over
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        if resume and checkpoint_path is not None and os.path.exists(checkpoint_path):
+            arrays, state = load_checkpoint(checkpoint_path)
+            if state["t"] < self.max_iter:
+                self.restore(arrays, state)
+
+    def save_state(self, path=None):
+        arrays, state = rng_state(self.rng)
+        arrays.update(positions=self.positions,
+                      leader_pos=np.stack((self.alpha_pos, self.beta_pos, self.delta_pos)),
+                      leader_scores=np.array([self.alpha_score, self.beta_score, self.delta_score]),
+                      curve=self.convergence_curve.to_array(), lb=self.lb, ub=self.ub)
+        state.update(t=self.t, curve_count=self.convergence_curve.count, max_iter=self.max_iter)
+        save_checkpoint(path or self.checkpoint_path, arrays, state)
+
+    def load_state(self, path=None):
+        self.restore(*load_checkpoint(path or self.checkpoint_path))
+
+    # Continue from a loaded snapshot; it must come from a run with the same
+    # wolves, dimension, bounds and iteration budget
+    def restore(self, arrays, state):
+        if (arrays["positions"].shape != (self.num_wolves, self.dim)
+                or not np.array_equal(arrays["lb"], self.lb)
+                or not np.array_equal(arrays["ub"], self.ub)
+                or state["max_iter"] != self.max_iter):
+            raise ValueError("Checkpoint was written for a different problem or configuration")
+        set_rng_state(arrays, state, self.rng)
+        self.positions = arrays["positions"]
+        self.alpha_pos, self.beta_pos, self.delta_pos = arrays["leader_pos"]
+        self.alpha_score, self.beta_score, self.delta_score = arrays["leader_scores"]
+        self.best_solution, self.best_fitness = self.alpha_pos, self.alpha_score
+        self.convergence_curve = ConvergenceHistory(self.convergence_curve.capacity)
+        self.convergence_curve.count = state["curve_count"] - len(arrays["curve"])
+        for value in arrays["curve"]:
+            self.convergence_curve.append(value)
+        self.t = state["t"]
+
+    def end_of_iteration(self):
+        self.t += 1
+        if self.checkpoint_path is not None and self.t % self.checkpoint_every == 0:
+            self.save_state()
+    
+    def optimize(self):
+        instr = self.instrumentation
+        while self.t < self.max_iter:
+            t = self.t
+            instr.mark()
+            # Ensure wolves stay inside bounds
+            np.clip(self.positions, self.lb, self.ub, out=self.positions)
+            scores = self.evaluate(self.positions)
+
+            for i, fitness in enumerate(scores):
+                # Update alpha, beta, delta
+                if fitness < self.alpha_score:
+                    self.alpha_score = fitness
+                    self.alpha_pos = self.positions[i].copy()
+                elif fitness < self.beta_score:
+                    self.beta_score = fitness
+                    self.beta_pos = self.positions[i].copy()
+                elif fitness < self.delta_score:
+                    self.delta_score = fitness
+                    self.delta_pos = self.positions[i].copy()
+            instr.count_evaluations(self.num_wolves)
+            instr.lap("evaluate")
+            
+            # Coefficient a decreases linearly from 2 to 0
+            a = 2 - t * (2 / self.max_iter)
+            
+            for i in range(self.num_wolves):
+                for j in range(self.dim):
+                    r1, r2 = self.rng.rand(), self.rng.rand()
+                    A1 = 2 * a * r1 - a
+                    C1 = 2 * r2
+                    D_alpha = abs(C1 * self.alpha_pos[j] - self.positions[i, j])
+                    X1 = self.alpha_pos[j] - A1 * D_alpha
+
+                    r1, r2 = self.rng.rand(), self.rng.rand()
+                    A2 = 2 * a * r1 - a
+                    C2 = 2 * r2
+                    D_beta = abs(C2 * self.beta_pos[j] - self.positions[i, j])
+                    X2 = self.beta_pos[j] - A2 * D_beta
+
+                    r1, r2 = self.rng.rand(), self.rng.rand()
+                    A3 = 2 * a * r1 - a
+                    C3 = 2 * r2
+                    D_delta = abs(C3 * self.delta_pos[j] - self.positions[i, j])
+                    X3 = self.delta_pos[j] - A3 * D_delta
+
+                    # Update position of wolf i in dimension j
+                    self.positions[i, j] = (X1 + X2 + X3) / 3
+
+            self.convergence_curve.append(self.alpha_score)
+            self.end_of_iteration()
+            instr.lap("update")
+            instr.end_iteration(self.alpha_score)
+        
+        return self.alpha_pos, self.alpha_score
+
+    def evaluate(self, candidates):
+        if self.batch_obj_func is not None:
+            return np.asarray(self.batch_obj_func(candidates), dtype=float)
+        return np.asarray(self.evaluator(candidates), dtype=float)
+
+    def evaluate_all(self):
+        return self.evaluate(self.positions)
+
+    # Keep the three best of (current leaders + pack) as alpha, beta, delta
+    def update_leaders(self, scores):
+        pool_scores = np.concatenate(([self.alpha_score, self.beta_score, self.delta_score], scores))
+        pool_pos = np.vstack((self.alpha_pos, self.beta_pos, self.delta_pos, self.positions))
+        top = np.argpartition(pool_scores, 2)[:3]
+        top = top[np.argsort(pool_scores[top])]
+        self.alpha_score, self.beta_score, self.delta_score = pool_scores[top]
+        self.alpha_pos, self.beta_pos, self.delta_pos = pool_pos[top]
+
+    def ask(self):
+        np.clip(self.positions, self.lb, self.ub, out=self.positions)
+        return self.positions
+
+    # Same update rule as optimize(), but every wolf and dimension at once
+    def tell(self, candidates, scores):
+        self.positions = candidates
+        self.update_leaders(scores)
+        self.best_solution, self.best_fitness = self.alpha_pos, self.alpha_score
+
+        a = 2 - self.t * (2 / self.max_iter)
+        leaders = np.stack((self.alpha_pos, self.beta_pos, self.delta_pos))[:, None, :]
+        r = self.rng.rand(2, 3, self.num_wolves, self.dim)
+        A = 2 * a * r[0] - a
+        C = 2 * r[1]
+        D = np.abs(C * leaders - self.positions)
+        self.positions = (leaders - A * D).mean(axis=0)
+        self.convergence_curve.append(self.alpha_score)
+        self.end_of_iteration()
+
+    def optimize_vectorized(self, termination=None):
+        self.run(self.max_iter - self.t, self.instrumentation, termination)
+        return self.alpha_pos, self.alpha_score
@@ -0,0 +1,137 @@
+import csv
+import json
+import time
+
+import numpy as np
+
+# ---------------------------------------------------------------
+# Instrumentation shared by all lab optimizers
+# ---------------------------------------------------------------
+# Optimizers take an `instrumentation` argument and call four hooks:
+#   mark()                      start timing at the top of an iteration
+#   lap(name)                   charge the time since the last mark/lap to `name`
+#   count_evaluations(n)        add n fitness evaluations
+#   end_iteration(best, **info) record the best-so-far and run callbacks
+# NULL_INSTRUMENTATION implements the same hooks as no-ops, so a run with
+# instrumentation off pays only for a few empty method calls per iteration.
+
+
+# Convergence history in a preallocated ring buffer: keeps the last
+# `capacity` values without growing
+class ConvergenceHistory:
+    def __init__(self, capacity=1024):
+        self.capacity = capacity
+        self.values = np.empty(capacity)
+        self.count = 0
+
+    def append(self, value):
+        self.values[self.count % self.capacity] = value
+        self.count += 1
+
+    # Iteration index (0-based) of the oldest value still kept
+    @property
+    def start(self):
+        return max(0, self.count - self.capacity)
+
+    def to_array(self):
+        if self.count <= self.capacity:
+            return self.values[:self.count].copy()
+        i = self.count % self.capacity
+        return np.concatenate((self.values[i:], self.values[:i]))
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def __iter__(self):
+        return iter(self.to_array())
+
+    def __getitem__(self, i):
+        return self.to_array()[i]
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.to_array()
+        return values if dtype is None else values.astype(dtype)
+
+
+class Instrumentation:
+    enabled = True
+
+    def __init__(self, history_size=1024, callbacks=()):
+        self.history = ConvergenceHistory(history_size)
+        self.callbacks = list(callbacks)
+        self.iteration = 0
+        self.evaluations = 0
+        self.timings = {"evaluate": 0.0, "update": 0.0}
+        self.best = None
+        self.started = time.perf_counter()
+        self._last = self.started
+
+    def mark(self):
+        self._last = time.perf_counter()
+
+    def lap(self, name):
+        now = time.perf_counter()
+        self.timings[name] = self.timings.get(name, 0.0) + (now - self._last)
+        self._last = now
+
+    def count_evaluations(self, n=1):
+        self.evaluations += n
+
+    def end_iteration(self, best, **info):
+        self.iteration += 1
+        self.best = best
+        self.history.append(best)
+        for callback in self.callbacks:
+            callback(self, best, info)
+
+    def summary(self):
+        elapsed = time.perf_counter() - self.started
+        return {
+            "iterations": self.iteration,
+            "evaluations": self.evaluations,
+            "elapsed": elapsed,
+            "evaluations_per_second": self.evaluations / elapsed if elapsed > 0 else 0.0,
+            "timings": dict(self.timings),
+            "best": None if self.best is None else float(self.best),
+        }
+
+    def to_json(self, path):
+        data = self.summary()
+        data["history_start"] = self.history.start
+        data["history"] = self.history.to_array().tolist()
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+    def to_csv(self, path):
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["iteration", "best"])
+            for i, value in enumerate(self.history, start=self.history.start + 1):
+                writer.writerow([i, value])
+
+
+class NullInstrumentation:
+    enabled = False
+
+    def mark(self):
+        pass
+
+    def lap(self, name):
+        pass
+
+    def count_evaluations(self, n=1):
+        pass
+
+    def end_iteration(self, best, **info):
+        pass
+
+
+NULL_INSTRUMENTATION = NullInstrumentation()
+
+
+# Callback printing one formatted line per iteration; the template sees
+# `iteration`, `best` and every keyword passed to end_iteration
+def progress_printer(template):
+    def callback(instrumentation, best, info):
+        print(template.format(iteration=instrumentation.iteration, best=best, **info))
+    return callback
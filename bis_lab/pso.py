@@ -0,0 +1,114 @@
+import random
+from math import sqrt
+import numpy as np
+from .base import Optimizer
+
+c1, c2 = 1, 1
+TOLERANCE = 1e-9        # gbest fitness change below this counts as converged
+MAX_ITERATIONS = 1000   # hard cap for the interactive loop
+
+
+def fitness(x):
+    return -x**2 + 5*x + 20
+
+
+def init():
+    n = int(input("Enter no. of particles: "))
+    v = [0 for i in range(n)]
+    x = list(map(float, input("Enter positions of particles:").split()))
+    p = x.copy()
+    fp = [fitness(xi) for xi in x]
+    return n, v, fp, p, x
+
+
+def find(n, fp, p):
+    max_fitness = float('-inf')
+    pos = -1
+    for i in range(n):
+        if fp[i] > max_fitness:
+            max_fitness = fp[i]
+            pos = i
+    return pos
+
+
+def update(n, v, fp, p, x, max_pos):
+    r1, r2 = sqrt(random.random()), sqrt(random.random())
+
+    for i in range(n):
+        v[i] = v[i] + c1 * r1 * (p[i] - x[i]) + c2 * r2 * (p[max_pos] - x[i])
+        x[i] = x[i] + v[i]
+
+    for i in range(n):
+        fp[i] = fitness(x[i])
+        if fp[i] > fitness(p[i]):
+            p[i] = x[i]
+
+
+def print_state(v, fp, p, x):
+    print(f'''
+    {x}
+    {p}
+    {v}
+    {fp}
+    ''')
+
+
+# Batched fitness for (n, D) positions: the 1-D fitness summed over dimensions
+def fitness_array(X):
+    return np.sum(-X**2 + 5*X + 20, axis=1)
+
+
+# Non-interactive PSO engine. Positions are an (n, D) matrix; personal-best
+# fitness is cached, and velocities and positions of all particles are
+# updated in one vectorized step. The first ask() hands out the initial
+# positions unmoved, so their evaluations go through tell() and count
+# towards the instrumentation and any Termination budget; every later ask()
+# moves the swarm first.
+class ParticleSwarm(Optimizer):
+    maximize = True
+
+    def __init__(self, positions, fitness=fitness_array, c1=c1, c2=c2, w=1.0,
+                 velocities=None, seed=None):
+        super().__init__(fitness)
+        self.x = np.array(positions, dtype=float)
+        if self.x.ndim == 1:
+            self.x = self.x[:, None]        # n scalar particles -> (n, 1)
+        self.v = np.zeros_like(self.x) if velocities is None else np.array(velocities, dtype=float).reshape(self.x.shape)
+        self.fitness = fitness
+        self.c1, self.c2, self.w = c1, c2, w
+        self.rng = np.random.default_rng(seed)
+
+        self.fx = self.p = self.fp = None   # set by the first tell()
+        self.max_pos = 0
+
+    @property
+    def gbest(self):
+        return self.p[self.max_pos]
+
+    @property
+    def gbest_fitness(self):
+        return self.fp[self.max_pos]
+
+    def move(self):
+        r1 = np.sqrt(self.rng.random(self.x.shape))
+        r2 = np.sqrt(self.rng.random(self.x.shape))
+        self.v *= self.w
+        self.v += self.c1 * r1 * (self.p - self.x) + self.c2 * r2 * (self.gbest - self.x)
+        self.x += self.v
+
+    def ask(self):
+        if self.p is not None:
+            self.move()
+        return self.x
+
+    def tell(self, candidates, fitness):
+        self.fx = np.asarray(fitness)
+        if self.p is None:
+            self.p = np.array(candidates, dtype=float)
+            self.fp = self.fx.astype(float)
+        else:
+            improved = self.fx > self.fp
+            self.p[improved] = candidates[improved]
+            self.fp[improved] = self.fx[improved]
+        self.max_pos = int(np.argmax(self.fp))
+        self.record_best(self.p, self.fp)
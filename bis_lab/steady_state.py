@@ -0,0 +1,87 @@
+import asyncio
+import inspect
+import random
+from .instrumentation import NULL_INSTRUMENTATION
+
+# ---------------------------------------------------------------
+# Asynchronous steady-state evolution
+# ---------------------------------------------------------------
+# There is no generation barrier: up to `in_flight` evaluations run at once,
+# and every result is inserted into the population as soon as it arrives,
+# after which a new offspring is bred from the current population and sent
+# off in its place. Slow evaluations therefore never leave workers idle.
+#
+# `evaluate` is either a coroutine function or a plain function; plain
+# functions run on `executor` (the event loop's default thread pool when
+# None; pass a ProcessPoolExecutor for pure-Python objectives).
+# `breed(population, fitness)` returns one new individual. Fitness is
+# maximized.
+#
+# The initial individuals are evaluated through the same pipeline, and
+# breeding starts as soon as two of them have a fitness. Once the population
+# is full, a child replaces either the worst individual ("worst") or the
+# loser of a reverse tournament of `tournament_size` ("tournament"), in
+# both cases only if the child is better.
+REPLACEMENTS = ("worst", "tournament")
+
+async def steady_state_evolution(initial, breed, evaluate, evaluations, in_flight=4, replacement="worst",
+                                 tournament_size=2, executor=None, instrumentation=None):
+    if replacement not in REPLACEMENTS:
+        raise ValueError(f"Unknown replacement strategy: {replacement}")
+    instr = instrumentation or NULL_INSTRUMENTATION
+    loop = asyncio.get_running_loop()
+    pop_size = len(initial)
+    queue = list(reversed(initial))     # initial individuals still to be sent
+    population, fitness = [], []
+    best_individual, best_fitness = None, float("-inf")
+
+    def submit(individual):
+        if inspect.iscoroutinefunction(evaluate):
+            future = asyncio.ensure_future(evaluate(individual))
+        else:
+            future = loop.run_in_executor(executor, evaluate, individual)
+        pending[future] = individual
+
+    def insert(individual, value):
+        if len(population) < pop_size:
+            population.append(individual)
+            fitness.append(value)
+            return
+        if replacement == "worst":
+            loser = min(range(pop_size), key=fitness.__getitem__)
+        else:
+            loser = min(random.sample(range(pop_size), min(tournament_size, pop_size)),
+                        key=fitness.__getitem__)
+        if value > fitness[loser]:
+            population[loser] = individual
+            fitness[loser] = value
+
+    pending = {}
+    sent = 0
+    instr.mark()
+    while sent < evaluations or pending:
+        # Keep the pipeline full; children need two evaluated parents
+        while sent < evaluations and len(pending) < in_flight and (queue or len(population) >= 2):
+            submit(queue.pop() if queue else breed(population, fitness))
+            sent += 1
+        if not pending:
+            break
+
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        instr.lap("evaluate")
+        for future in done:
+            individual = pending.pop(future)
+            value = future.result()
+            insert(individual, value)
+            if value > best_fitness:
+                best_individual, best_fitness = individual, value
+            instr.count_evaluations(1)
+        instr.lap("update")
+        instr.end_iteration(best_fitness, individual=best_individual)
+        instr.mark()
+
+    return best_individual, best_fitness
+
+# Blocking entry point for code that is not already inside an event loop
+def run_steady_state(*args, **kwargs):
+    return asyncio.run(steady_state_evolution(*args, **kwargs))
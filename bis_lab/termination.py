@@ -0,0 +1,67 @@
+import time
+from collections import deque
+
+# ---------------------------------------------------------------
+# Anytime / deadline termination
+# ---------------------------------------------------------------
+# Stopping rules for Optimizer.run, checked before every iteration:
+#   time_limit         wall-clock seconds from the start of the run
+#   max_evaluations    total fitness evaluations
+#   stagnation_window  stop when the best fitness improved by no more than
+#   tolerance          `tolerance` over the last `stagnation_window` iterations
+#
+# An iteration is only started if it is predicted to finish in time: the
+# prediction is the slowest of the last `timing_window` iterations, and an
+# iteration is not started if its batch, sized like the previous one, would
+# go over max_evaluations. The first iteration always runs, since nothing
+# is known about its cost yet. After the run, `reason` names the rule that
+# stopped it (None if the caller's iteration count ran out first).
+class Termination:
+    def __init__(self, time_limit=None, max_evaluations=None, stagnation_window=None, tolerance=0.0,
+                 timing_window=8):
+        self.time_limit = time_limit
+        self.max_evaluations = max_evaluations
+        self.stagnation_window = stagnation_window
+        self.tolerance = tolerance
+        self.timing_window = timing_window
+        self.start()
+
+    def start(self, maximize=False):
+        self.maximize = maximize
+        self.started = time.perf_counter()
+        self.last = self.started
+        self.durations = deque(maxlen=self.timing_window)
+        self.history = deque(maxlen=(self.stagnation_window or 0) + 1)
+        self.evaluations = 0
+        self.batch = 0
+        self.iterations = 0
+        self.reason = None
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def predicted_iteration_time(self):
+        return max(self.durations) if self.durations else 0.0
+
+    def should_continue(self):
+        if self.iterations == 0:
+            return True
+        if self.time_limit is not None and self.elapsed() + self.predicted_iteration_time() > self.time_limit:
+            self.reason = "time_limit"
+        elif self.max_evaluations is not None and self.evaluations + self.batch > self.max_evaluations:
+            self.reason = "max_evaluations"
+        elif self.stagnation_window and len(self.history) == self.history.maxlen:
+            gain = self.history[-1] - self.history[0]
+            if (gain if self.maximize else -gain) <= self.tolerance:
+                self.reason = "stagnation"
+        return self.reason is None
+
+    # Record one finished iteration
+    def update(self, best, evaluations):
+        now = time.perf_counter()
+        self.durations.append(now - self.last)
+        self.last = now
+        self.evaluations += evaluations
+        self.batch = evaluations
+        self.iterations += 1
+        self.history.append(float(best))
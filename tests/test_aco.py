@@ -0,0 +1,114 @@
+import random
+
+import numpy as np
+import pytest
+
+from bis_lab import Instrumentation, aco
+from bis_lab.aco import CityGrid, PheromoneStore
+
+
+@pytest.mark.parametrize("tau_min, tau_max", [(None, None), (0.05, 2.0)])
+def test_pheromone_store_matches_dense_evaporation(tau_min, tau_max):
+    rng = np.random.default_rng(0)
+    store = PheromoneStore((6, 6), 1.0, tau_min, tau_max, renormalize_below=1e-3)
+    dense = np.ones((6, 6))
+    for _ in range(40):
+        store.evaporate(0.3)
+        dense *= 0.7
+        index = (rng.integers(0, 6, 4), rng.integers(0, 6, 4))
+        amounts = rng.random(4)
+        store.deposit(index, amounts)
+        np.add.at(dense, index, amounts)
+        expected = dense if tau_min is None else np.clip(dense, tau_min, tau_max)
+        np.testing.assert_allclose(store.read(), expected)
+    assert store.scale > 1e-3       # renormalized along the way
+
+
+def brute_force_neighbours(xy, k):
+    d = np.hypot(xy[:, None, 0] - xy[:, 0], xy[:, None, 1] - xy[:, 1])
+    np.fill_diagonal(d, np.inf)
+    return np.sort(d, axis=1)[:, :k]
+
+
+def clustered(rng):
+    return np.concatenate([rng.normal(c, 0.01, (40, 2)) for c in rng.random((5, 2))])
+
+
+@pytest.mark.parametrize("make", [lambda rng: rng.random((300, 2)), clustered])
+def test_nearest_neighbours_match_brute_force(make):
+    xy = make(np.random.default_rng(1))
+    _, dist = aco.nearest_neighbours(xy, 6)
+    np.testing.assert_allclose(dist, brute_force_neighbours(xy, 6))
+
+
+@pytest.mark.parametrize("make", [lambda rng: rng.random((300, 2)), clustered])
+def test_nearest_unvisited_matches_brute_force(make):
+    rng = np.random.default_rng(2)
+    xy = make(rng)
+    grid = CityGrid(xy)
+    for _ in range(100):
+        visited = rng.random(len(xy)) < rng.random()
+        city = rng.integers(len(xy))
+        visited[city] = True
+        if visited.all():
+            continue
+        free = np.flatnonzero(~visited)
+        nearest = np.hypot(*(xy[free] - xy[city]).T).min()
+        assert np.hypot(*(xy[grid.nearest_unvisited(city, visited)] - xy[city])) == pytest.approx(nearest)
+
+
+def test_sparse_tours_are_permutations():
+    xy = np.random.default_rng(3).random((200, 2))
+    candidates, _ = aco.nearest_neighbours(xy, 3)
+    tours = aco.construct_tours_sparse(xy, candidates, np.ones(candidates.shape), 4, np.random.default_rng(4))
+    assert all(np.array_equal(np.sort(tour), np.arange(len(xy))) for tour in tours)
+
+
+def small_cities():
+    return [tuple(c) for c in np.random.default_rng(5).random((8, 2))]
+
+
+class Killed(Exception):
+    pass
+
+
+# Runs ant_colony_tsp until iteration `at`, as if the job had been killed there
+def run_until_killed(at, **kwargs):
+    def kill(instrumentation, best, info):
+        if instrumentation.iteration == at:
+            raise Killed
+    with pytest.raises(Killed):
+        aco.ant_colony_tsp(small_cities(), instrumentation=Instrumentation(callbacks=[kill]), **kwargs)
+
+
+def test_resume_matches_uninterrupted_run(tmp_path):
+    path = str(tmp_path / "aco.npz")
+    random.seed(6)
+    expected = aco.ant_colony_tsp(small_cities(), iterations=20)
+
+    random.seed(6)
+    run_until_killed(15, iterations=20, checkpoint_path=path)
+    assert aco.ant_colony_tsp(small_cities(), iterations=20, checkpoint_path=path, resume=True) == expected
+
+
+def test_resume_is_explicit_and_skips_finished_runs(tmp_path):
+    path = str(tmp_path / "aco.npz")
+    run_until_killed(15, iterations=20, checkpoint_path=path)
+    instr = Instrumentation()
+    aco.ant_colony_tsp(small_cities(), iterations=20, checkpoint_path=path, instrumentation=instr)
+    assert instr.iteration == 20
+
+    for iterations in (20, 5):
+        instr = Instrumentation()
+        aco.ant_colony_tsp(small_cities(), iterations=iterations, checkpoint_path=path, resume=True,
+                           instrumentation=instr)
+        assert instr.iteration == iterations
+
+
+@pytest.mark.parametrize("kwargs", [{"ants": 50}, {"rho": 0.1}, {"alpha": 2}, {"tau_max": 5.0},
+                                    {"iterations": 40}])
+def test_resume_rejects_other_configurations(tmp_path, kwargs):
+    path = str(tmp_path / "aco.npz")
+    run_until_killed(15, iterations=20, checkpoint_path=path)
+    with pytest.raises(ValueError):
+        aco.ant_colony_tsp(small_cities(), checkpoint_path=path, resume=True, **{"iterations": 20, **kwargs})
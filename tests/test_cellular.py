@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from bis_lab import cellular
+
+
+def brute_force_window_mean(grid, radius):
+    rows, cols = grid.shape
+    means = np.empty_like(grid)
+    for i in range(rows):
+        for j in range(cols):
+            window = [grid[(i + di) % rows, (j + dj) % cols]
+                      for di in range(-radius, radius + 1) for dj in range(-radius, radius + 1)]
+            means[i, j] = np.mean(window)
+    return means
+
+
+@pytest.mark.parametrize("shape, radius", [((10, 10), 1), ((7, 12), 2), ((5, 3), 3)])
+def test_window_mean_matches_brute_force(shape, radius):
+    grid = np.random.default_rng(0).uniform(-10, 10, shape)
+    np.testing.assert_allclose(cellular.neighborhood_mean(grid, radius), brute_force_window_mean(grid, radius))
+
+
+@pytest.mark.parametrize("tile", [((0, 3), (0, 11)), ((3, 6), (3, 7)), ((6, 9), (0, 4)),
+                                  ((3, 6), (8, 11)), ((0, 9), (0, 11))])
+def test_tile_halo_matches_wrap_padding(tile):
+    grid = np.random.default_rng(1).random((9, 11))
+    (r0, r1), (c0, c1) = tile
+    padded = np.pad(grid, 2, mode="wrap")
+    np.testing.assert_array_equal(cellular._tile_with_halo(grid, tile, 2), padded[r0:r1 + 4, c0:c1 + 4])
+
+
+def test_interior_tile_is_read_in_place():
+    grid = np.random.default_rng(2).random((9, 11))
+    assert np.shares_memory(cellular._tile_with_halo(grid, ((3, 6), (3, 7)), 2), grid)
+
+
+def test_multicore_is_reproducible():
+    run = lambda: cellular.parallel_cellular_algorithm_multicore((24, 24), 5, workers=1, tiles=(2, 2), seed=3)
+    assert run() == run()
+
+
+@pytest.mark.parametrize("tiles", [(6, 1), (1, 5), (0, 1)])
+def test_multicore_rejects_empty_tiles(tiles):
+    with pytest.raises(ValueError, match="non-empty tiles"):
+        cellular.parallel_cellular_algorithm_multicore((4, 4), 1, workers=1, tiles=tiles)
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from bis_lab import cuckoo
+from bis_lab.cuckoo import PackedNests
+
+
+def knapsack(items, seed=0):
+    rng = np.random.default_rng(seed)
+    weights, values = rng.integers(1, 100, items), rng.integers(1, 100, items)
+    return weights, values, int(weights.sum() // 2)
+
+
+def test_delta_and_repack_match_full_recomputation():
+    weights, values, capacity = knapsack(50)
+    rng = np.random.default_rng(1)
+    nests = PackedNests.random(6, weights, values, 0.7, rng)
+    rows, cols = cuckoo._random_bits(np.full(6, 20), 50, rng)
+    rows, cols = nests.repack_flips(rows, cols, capacity)
+
+    dw, dv = nests.delta(rows, cols)
+    weight, value = nests.total_weight + dw, nests.total_value + dv
+    nests.flip(rows, cols)
+    unpacked = np.array([nests.unpack(i) for i in range(len(nests))])
+    np.testing.assert_array_equal(unpacked @ weights, weight)
+    np.testing.assert_array_equal(unpacked @ values, value)
+
+
+def test_packed_search_returns_a_feasible_solution_with_its_value():
+    weights, values, capacity = knapsack(2000)
+    bits, value = cuckoo.cuckoo_search_knapsack_packed(max_iter=200, weights=weights, values=values,
+                                                       capacity=capacity, density=0.9, seed=2)
+    assert bits @ weights <= capacity
+    assert bits @ values == value
+    assert value > values.sum() / 2     # well past a random half-full knapsack
+
+
+def padded_instances():
+    rng = np.random.default_rng(3)
+    sizes = [12, 7, 3]
+    weights = np.zeros((3, 12), dtype=np.int64)
+    values = np.zeros((3, 12), dtype=np.int64)
+    for i, size in enumerate(sizes):
+        weights[i, :size] = rng.integers(1, 30, size)
+        values[i, :size] = rng.integers(1, 30, size)
+    return weights, values, weights.sum(axis=1) // 2, sizes
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("pass_counts", [True, False])
+def test_batch_never_packs_padding(pass_counts):
+    weights, values, capacities, sizes = padded_instances()
+    nests, best = cuckoo.cuckoo_search_knapsack_batch(weights, values, capacities, max_iter=30, seed=4,
+                                                      item_counts=sizes if pass_counts else None)
+    for i, size in enumerate(sizes):
+        assert not nests[i, size:].any()
+        assert nests[i] @ weights[i] <= capacities[i]
+        assert nests[i] @ values[i] == best[i]
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_batch_matches_brute_force_on_small_instances():
+    weights, values, capacities, sizes = padded_instances()
+    _, best = cuckoo.cuckoo_search_knapsack_batch(weights[1:], values[1:], capacities[1:], max_iter=100,
+                                                  item_counts=sizes[1:], seed=5)
+    for i, size in enumerate(sizes[1:], start=1):
+        choices = (np.arange(2**size)[:, None] >> np.arange(size)) & 1
+        feasible = choices @ weights[i, :size] <= capacities[i]
+        assert best[i - 1] == (choices @ values[i, :size])[feasible].max()
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from bis_lab import ProcessEvaluator, SerialEvaluator, ThreadEvaluator, make_evaluator
+
+
+def cube(x):
+    return x ** 3
+
+
+@pytest.mark.parametrize("backend", ["serial", "thread", "process"])
+def test_backends_keep_candidate_order(backend):
+    candidates = np.arange(-20, 23)
+    with make_evaluator(cube, backend, workers=2) as evaluate:
+        for _ in range(3):          # later batches reuse the pool with adapted chunks
+            np.testing.assert_array_equal(evaluate(candidates), candidates ** 3)
+        assert evaluate([]).size == 0
+
+
+def test_make_evaluator_picks_the_backend():
+    assert type(make_evaluator(cube)) is SerialEvaluator
+    assert type(make_evaluator(cube, "thread")) is ThreadEvaluator
+    assert type(make_evaluator(cube, "process")) is ProcessEvaluator
+    with pytest.raises(ValueError):
+        make_evaluator(cube, "cluster")
+
+
+def test_chunk_size_adapts_to_item_time():
+    evaluate = ThreadEvaluator(cube, workers=4, target_chunk_time=0.01)
+    assert evaluate.chunk_size(100) == 7             # four chunks per worker before anything is timed
+    evaluate.item_time = 1e-6
+    assert evaluate.chunk_size(100) == 25            # cheap items: capped at one chunk per worker
+    evaluate.item_time = 1e-3
+    assert evaluate.chunk_size(100) == 10            # about target_chunk_time per chunk
+    assert ThreadEvaluator(cube, chunksize=3).chunk_size(100) == 3
+
+
+def test_pool_is_reused_and_closed():
+    evaluate = ThreadEvaluator(cube, workers=2)
+    evaluate([1, 2, 3])
+    executor = evaluate._executor
+    evaluate([4, 5])
+    assert evaluate._executor is executor
+    evaluate.close()
+    assert evaluate._executor is None
@@ -0,0 +1,67 @@
+import random
+
+import numpy as np
+import pytest
+
+from bis_lab import RouletteSelector, gene_expression
+
+
+@pytest.mark.parametrize("method", ["cumsum", "alias"])
+def test_roulette_frequencies_follow_fitness(method):
+    fitnesses = [5.0, 1.0, 0.0, 3.0, 1.0]
+    picks = RouletteSelector(fitnesses, method, rng=0).sample(200_000)
+    frequencies = np.bincount(picks, minlength=len(fitnesses)) / len(picks)
+    np.testing.assert_allclose(frequencies, np.array(fitnesses) / sum(fitnesses), atol=0.005)
+
+
+@pytest.mark.parametrize("method", ["cumsum", "alias"])
+def test_roulette_shifts_negative_and_handles_zero_fitness(method):
+    shifted = RouletteSelector([-2.0, -1.0, 0.0], method, rng=1)
+    np.testing.assert_allclose(shifted.p, [0, 1 / 3, 2 / 3])
+    assert 0 not in shifted.sample(1000)
+
+    uniform = RouletteSelector([0.0, 0.0, 0.0, 0.0], method, rng=2)
+    np.testing.assert_allclose(uniform.p, 0.25)
+    assert set(uniform.sample(1000)) == {0, 1, 2, 3}
+
+
+def test_roulette_rejects_unknown_method():
+    with pytest.raises(ValueError):
+        RouletteSelector([1.0, 2.0], "wheel")
+
+
+def test_scalar_runs_are_reproducible_with_random_seed():
+    results = []
+    for _ in range(2):
+        random.seed(9)
+        results.append((gene_expression.gene_expression_algorithm(),
+                        gene_expression.gene_expression_algorithm_steady_state(in_flight=1)))
+    assert results[0] == results[1]
+
+
+@pytest.mark.parametrize("topology", gene_expression.TOPOLOGIES)
+def test_migration_routes(topology):
+    routes = gene_expression.migration_routes(4, topology, rng=0)
+    assert all(source != destination and 0 <= destination < 4 for source, destination in routes)
+    assert {source for source, _ in routes} == {0, 1, 2, 3}
+    if topology == "ring":
+        assert routes == [(0, 1), (1, 2), (2, 3), (3, 0)]
+    if topology == "full":
+        assert len(routes) == 12
+    assert gene_expression.migration_routes(1, topology) == []
+
+
+def test_islands_are_reproducible_for_a_seed():
+    run = lambda: gene_expression.gene_expression_algorithm_islands(islands=2, population_size=6, generations=6,
+                                                                    migration_interval=2, seed=4)
+    (solution, fitness), (again, fitness_again) = run(), run()
+    assert fitness == fitness_again
+    np.testing.assert_array_equal(solution, again)
+    assert fitness == gene_expression.evaluate_population_array(solution[None])[0]
+
+
+@pytest.mark.parametrize("kwargs", [{"islands": 0}, {"migration_interval": 0}, {"migrants": -1},
+                                    {"topology": "star"}])
+def test_islands_reject_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        gene_expression.gene_expression_algorithm_islands(**kwargs)
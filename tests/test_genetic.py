@@ -0,0 +1,92 @@
+import random
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from bis_lab import genetic
+from bis_lab.genetic import FitnessCache, PackedPopulation
+
+
+def random_strings(rng, n, genes):
+    return [''.join(rng.choice(['0', '1'], genes)) for _ in range(n)]
+
+
+@pytest.mark.parametrize("genes", [1, 5, 8, 13, 64, 70])
+def test_packed_round_trip(genes):
+    individuals = random_strings(np.random.default_rng(genes), 9, genes)
+    population = PackedPopulation.from_strings(individuals)
+
+    assert population.to_strings() == individuals
+    assert [population[i] for i in range(len(population))] == individuals
+    assert [int(x) for x in population.decode()] == [int(s, 2) for s in individuals]
+
+
+@pytest.mark.parametrize("genes", [5, 13, 70])
+def test_packed_crossover_matches_string_crossover(genes):
+    individuals = random_strings(np.random.default_rng(0), 7, genes)
+    population = PackedPopulation.from_strings(individuals)
+    children = population.crossover(np.random.default_rng(1), rate=0.7).to_strings()
+
+    # Same draws as PackedPopulation.crossover, applied by string slicing
+    rng = np.random.default_rng(1)
+    pairs = len(individuals) // 2
+    points = rng.integers(1, genes, pairs)
+    points[rng.random(pairs) >= 0.7] = genes
+    expected = list(individuals)
+    for k, point in enumerate(points):
+        p1, p2 = individuals[2 * k], individuals[2 * k + 1]
+        expected[2 * k] = p1[:point] + p2[point:]
+        expected[2 * k + 1] = p2[:point] + p1[point:]
+    assert children == expected
+
+
+def test_packed_mutation_flips_bits_in_place_of_strings():
+    individuals = random_strings(np.random.default_rng(2), 6, 13)
+    population = PackedPopulation.from_strings(individuals)
+    assert population.mutate(np.random.default_rng(3), rate=0.0).to_strings() == individuals
+
+    flipped = population.mutate(np.random.default_rng(3), rate=1.0).to_strings()
+    assert flipped == [s.translate(str.maketrans('01', '10')) for s in individuals]
+
+
+def test_packed_mutation_rate_and_memory():
+    population = PackedPopulation.random(2000, 4000, np.random.default_rng(4))
+    tracemalloc.start()
+    mutated = population.mutate(np.random.default_rng(5), rate=0.1)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    flipped = np.unpackbits(mutated.bits ^ population.bits, axis=1, count=4000)
+    assert abs(flipped.mean() - 0.1) < 0.005
+    assert peak < 8 * population.bits.nbytes       # an index per bit would be 64x
+
+
+def test_fitness_cache_is_per_run():
+    first, second = FitnessCache(genetic.fitness), FitnessCache(genetic.fitness)
+    random.seed(4)
+    best = genetic.genetic_algorithm(cache=first)
+    random.seed(4)
+    assert genetic.genetic_algorithm(cache=second) == best
+    assert first.stats() == second.stats()
+    assert best[1] == genetic.fitness(best[0])
+
+
+def test_fitness_cache_evicts_least_recently_used():
+    calls = []
+    cache = FitnessCache(lambda genome: calls.append(genome) or int(genome, 2), maxsize=2)
+    for genome in ["001", "010", "001", "100", "010", "001"]:
+        cache(genome)
+    # "010" was least recently used when "100" arrived, then "001" when "010" came back
+    assert calls == ["001", "010", "100", "010", "001"]
+    assert cache.stats() == {"hits": 1, "misses": 5, "evictions": 3, "size": 2, "hit_rate": 1 / 6}
+    cache.clear()
+    assert cache.stats()["size"] == cache.stats()["hits"] == 0
+
+
+def test_genetic_algorithm_keeps_no_module_level_cache():
+    random.seed(8)
+    first = genetic.genetic_algorithm()
+    random.seed(8)
+    assert genetic.genetic_algorithm() == first
+    assert not any(isinstance(value, FitnessCache) for value in vars(genetic).values())
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from bis_lab import GreyWolfOptimizer
+
+
+def sphere(X):
+    return np.sum(X**2, axis=1)
+
+
+def make(dim=3, wolves=10, max_iter=30, **kwargs):
+    return GreyWolfOptimizer(None, [-5] * dim, [5] * dim, dim, wolves, max_iter, batch_obj_func=sphere, seed=1,
+                             **kwargs)
+
+
+def test_resume_matches_uninterrupted_run(tmp_path):
+    path = str(tmp_path / "gwo.npz")
+    expected = make().optimize_vectorized()
+    curve = make()
+    curve.optimize_vectorized()
+
+    make(checkpoint_path=path, checkpoint_every=10).run(15)     # "killed" after iteration 15
+    resumed = make(checkpoint_path=path, resume=True)
+    assert resumed.t == 10
+    solution, fitness = resumed.optimize_vectorized()
+
+    assert fitness == expected[1]
+    np.testing.assert_array_equal(solution, expected[0])
+    np.testing.assert_array_equal(resumed.convergence_curve.to_array(), curve.convergence_curve.to_array())
+
+
+def test_resume_is_explicit_and_skips_finished_runs(tmp_path):
+    path = str(tmp_path / "gwo.npz")
+    make(checkpoint_path=path, checkpoint_every=10).run(15)
+    assert make(checkpoint_path=path).t == 0
+
+    make(checkpoint_path=path, checkpoint_every=10).optimize_vectorized()
+    assert make(checkpoint_path=path, resume=True).t == 0
+
+
+@pytest.mark.parametrize("kwargs", [{"dim": 4}, {"wolves": 12}, {"max_iter": 40}])
+def test_resume_rejects_other_configurations(tmp_path, kwargs):
+    path = str(tmp_path / "gwo.npz")
+    make(checkpoint_path=path, checkpoint_every=10).run(15)
+    with pytest.raises(ValueError):
+        make(checkpoint_path=path, resume=True, **kwargs)
@@ -0,0 +1,39 @@
+import random
+
+import numpy as np
+import pytest
+
+from bis_lab import Instrumentation, aco, cellular, cuckoo, gene_expression, genetic
+
+RUNS = {
+    "ga": lambda instr: genetic.genetic_algorithm(instr),
+    "gea": lambda instr: gene_expression.gene_expression_algorithm(instr),
+    "aco": lambda instr: aco.ant_colony_tsp([tuple(c) for c in np.random.default_rng(0).random((8, 2))],
+                                            iterations=3, instrumentation=instr),
+    "aco-parallel": lambda instr: aco.ant_colony_tsp_parallel(np.random.default_rng(0).random((20, 2)),
+                                                              iterations=3, workers=1, seed=0,
+                                                              instrumentation=instr),
+    "cuckoo": lambda instr: cuckoo.cuckoo_search_knapsack(max_iter=3, instrumentation=instr),
+    "cellular-multicore": lambda instr: cellular.parallel_cellular_algorithm_multicore(
+        (12, 12), 3, workers=1, tiles=(2, 2), seed=0, instrumentation=instr),
+    "cellular-out-of-core": lambda instr: cellular.parallel_cellular_algorithm_out_of_core(
+        (12, 12), 3, band_rows=5, seed=0, instrumentation=instr),
+}
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("name", sorted(RUNS))
+def test_evaluation_and_update_are_timed_separately(name):
+    random.seed(0)
+    instr = Instrumentation()
+    RUNS[name](instr)
+    assert instr.timings["evaluate"] > 0
+    assert instr.timings["update"] > 0
+    assert instr.evaluations > 0 and instr.iteration > 0
+
+
+def test_library_runs_are_quiet(capsys):
+    random.seed(0)
+    genetic.genetic_algorithm()
+    gene_expression.gene_expression_algorithm()
+    assert capsys.readouterr().out == ""
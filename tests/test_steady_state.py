@@ -0,0 +1,67 @@
+import asyncio
+import random
+
+import pytest
+
+from bis_lab import Instrumentation, genetic, run_steady_state
+
+
+def breed(population, fitness):
+    return random.randint(0, 1000)
+
+
+def test_evaluates_exactly_the_budget_and_keeps_the_best():
+    random.seed(1)
+    seen = []
+
+    def evaluate(x):
+        seen.append(x)
+        return -abs(x - 500)
+
+    instr = Instrumentation()
+    best, best_fitness = run_steady_state(list(range(10)), breed, evaluate, 60, in_flight=3, instrumentation=instr)
+    assert len(seen) == instr.evaluations == 60
+    assert set(range(10)) <= set(seen)          # every initial individual is evaluated
+    assert best_fitness == max(-abs(x - 500) for x in seen)
+    assert evaluate(best) == best_fitness
+
+
+@pytest.mark.parametrize("replacement", ["worst", "tournament"])
+def test_children_replace_only_worse_individuals(replacement):
+    random.seed(2)
+    snapshots = []
+
+    def tracking_breed(population, fitness):
+        snapshots.append(sorted(fitness))
+        return breed(population, fitness)
+
+    run_steady_state([0, 1, 2, 3], tracking_breed, lambda x: x, 80, in_flight=1, replacement=replacement)
+    full = [s for s in snapshots if len(s) == 4]
+    for before, after in zip(full, full[1:]):
+        assert after >= before      # elementwise on sorted fitness: nothing ever gets worse
+
+
+def test_coroutine_evaluations_run_concurrently():
+    running, peak = 0, 0
+
+    async def evaluate(x):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return x
+
+    run_steady_state(list(range(8)), breed, evaluate, 40, in_flight=4)
+    assert peak == 4
+
+
+def test_rejects_unknown_replacement():
+    with pytest.raises(ValueError):
+        run_steady_state([0, 1], breed, lambda x: x, 4, replacement="oldest")
+
+
+def test_steady_state_ga_returns_an_evaluated_individual():
+    random.seed(3)
+    best, best_fitness = genetic.genetic_algorithm_steady_state(evaluations=40, in_flight=2)
+    assert best_fitness == genetic.fitness(best)
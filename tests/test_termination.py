@@ -0,0 +1,25 @@
+import numpy as np
+
+from bis_lab import Instrumentation, ParticleSwarm, Termination, make_evaluator
+
+
+def test_first_iteration_always_runs():
+    termination = Termination(time_limit=0)
+    solution, fitness = ParticleSwarm(np.random.default_rng(0).random((5, 2)), seed=1).run(termination=termination)
+    assert solution is not None and np.isfinite(fitness)
+    assert termination.iterations == 1
+    assert termination.reason == "time_limit"
+
+
+def test_particle_swarm_counts_initial_evaluations():
+    instr = Instrumentation()
+    termination = Termination(max_evaluations=35)
+    ParticleSwarm(np.random.default_rng(0).random((10, 2)), seed=1).run(instrumentation=instr,
+                                                                         termination=termination)
+    assert instr.evaluations == termination.evaluations == 30
+    assert termination.reason == "max_evaluations"
+
+
+def test_serial_evaluator_ignores_pool_options():
+    evaluate = make_evaluator(abs, "serial", workers=4, chunksize=2)
+    np.testing.assert_array_equal(evaluate([-1, 2, -3]), [1, 2, 3])